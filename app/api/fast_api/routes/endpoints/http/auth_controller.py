@@ -11,6 +11,7 @@ from app.infrastructure.settings.config import ACCESS_TOKEN_EXPIRE_DAYS
 from app.domain.dto.user import UserDB
 from app.domain.entities.user import User as UserEntity
 from app.domain.dto.auth import Token
+from app.domain.exceptions.user import UserDoesNotExist
 
 router = APIRouter()
 
@@ -20,8 +21,11 @@ async def authenticate_user(
     password: str,
     user_service: UserService = Depends(get_user_service)
     ) -> UserDB | None:
-    user = await user_service._get_by_email(email)
-    if not user or not verify_password(password, user.password_hash):
+    try:
+        user = await user_service._get_for_login(email)
+    except UserDoesNotExist:
+        return None
+    if not verify_password(password, user.password_hash):
         return None
     return user
 
@@ -24,6 +24,7 @@ from app.infrastructure.database.models.user import User
 from app.services.core_services.comment_service import CommentService
 from app.dependencies.services.comment import get_comment_service
 from app.dependencies.auth import get_current_active_user
+from app.dependencies.etag import ETag
 
 router = APIRouter(prefix='/comments')
 
@@ -38,7 +39,7 @@ async def create_comment(
     return await comment_service.save(comment, current_user.id)
 
 
-@router.get('/{post_id}')
+@router.get('/{post_id}', dependencies=[Depends(ETag('comments:{post_id}'))])
 async def read_comments(
     pagination: Annotated[CommentPagination, Query()],
     post_id: int = Path(gt=0),
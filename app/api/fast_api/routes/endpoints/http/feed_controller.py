@@ -0,0 +1,26 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, HTTPException
+
+from app.domain.dto.user import UserDB
+from app.domain.dto.pagination import CursorPaginatedResponse, FeedPagination
+from app.domain.exceptions.base import InvalidCursorError
+
+from app.services.core_services.feed_service import FeedService
+from app.dependencies.auth import get_current_active_user
+from app.dependencies.services.feed import get_feed_service
+
+router = APIRouter(prefix='/feed')
+
+
+@router.get('/')
+async def read_feed(
+        pagination: Annotated[FeedPagination, Query()],
+        current_user: UserDB = Depends(get_current_active_user),
+        feed_service: FeedService = Depends(get_feed_service)
+        ) -> CursorPaginatedResponse:
+    """Лента постов пользователей, на которых подписан текущий пользователь."""
+    try:
+        return await feed_service.get_feed(current_user.id, pagination.cursor, pagination.limit)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=e.message)
@@ -2,12 +2,12 @@ from typing import Annotated
 from fastapi import APIRouter, Query, Depends, HTTPException
 
 from app.domain.dto.pagination import LikePagination, PaginatedResponse
-from app.domain.dto.like import LikeCreate
+from app.domain.dto.like import LikeCreate, LikeStatusRequest, LikeStatus, LikeState
 from app.domain.entities.like import Like
 from app.domain.entities.user import User
+from app.domain.exceptions.post import PostDoesNotExist
 from app.domain.exceptions.like import (
     AlreadyLikedPost,
-    LikeDoesNotExist,
     LikeDeleteError,
 )
 
@@ -39,6 +39,33 @@ async def create_like(
         return await like_service.save(like.post_id, current_user.id)
     except AlreadyLikedPost as e:
         raise HTTPException(status_code=409, detail=e.message)
+    except PostDoesNotExist as e:
+        raise HTTPException(status_code=404, detail=e.message)
+
+
+@router.put('/{post_id}')
+async def like_post(
+        post_id: int,
+        current_user: User = Depends(get_current_active_user),
+        like_service: LikeService = Depends(get_like_service)
+        ) -> LikeState:
+    """Идемпотентно ставит лайк посту."""
+    try:
+        liked = await like_service.like(post_id, current_user.id)
+        return LikeState(post_id=post_id, liked=liked)
+    except PostDoesNotExist as e:
+        raise HTTPException(status_code=404, detail=e.message)
+
+
+@router.post('/status')
+async def read_like_status(
+        request: LikeStatusRequest,
+        current_user: User = Depends(get_current_active_user),
+        like_service: LikeService = Depends(get_like_service)
+        ) -> LikeStatus:
+    """Возвращает ID постов из списка, которые лайкнул текущий пользователь."""
+    post_ids = await like_service.get_liked_post_ids(current_user.id, request.post_ids)
+    return LikeStatus(post_ids=post_ids)
 
 
 @router.delete('/{post_id}')
@@ -46,11 +73,10 @@ async def delete_like(
         post_id: int,
         current_user: User = Depends(get_current_active_user),
         like_service: LikeService = Depends(get_like_service)
-        ) -> None:
-    """Удаление лайка с поста."""
+        ) -> LikeState:
+    """Идемпотентно удаляет лайк текущего пользователя с поста."""
     try:
-        return await like_service.delete(post_id, current_user.id)
-    except LikeDoesNotExist as e:
-        raise HTTPException(status_code=404, detail=e.message)
+        liked = await like_service.unlike(post_id, current_user.id)
+        return LikeState(post_id=post_id, liked=liked)
     except LikeDeleteError as e:
         raise HTTPException(status_code=500, detail=e.message)
@@ -5,7 +5,8 @@ from fastapi import (
     Depends,
     Path,
     Query,
-    HTTPException
+    HTTPException,
+    Response
 )
 
 from app.domain.exceptions.base import AccessError
@@ -17,7 +18,13 @@ from app.domain.exceptions.chat import (
     MessageUpdateError
 )
 from app.domain.dto.chat import ChatMessageUpdate
-from app.domain.dto.pagination import PaginatedResponse, MessagePagination
+from app.domain.dto.pagination import (
+    ChatHistoryResponse,
+    PaginatedResponse,
+    MessageHistoryPagination,
+    MessagePagination,
+    MessageResumePagination
+)
 from app.domain.entities.chat import Chat, ChatMessage
 
 from app.dependencies.auth import get_current_user
@@ -39,22 +46,43 @@ async def start_chat(target_user_id: Annotated[int, Path(gt=0)],
         raise HTTPException(status_code=409, detail=e.message)
 
 
-@router.get("/my_chats")
+@router.get("/my_chats", response_model=PaginatedResponse)
 async def get_my_chats(pagination: Annotated[MessagePagination, Query()],
                        user: User = Depends(get_current_user),
                        message_service: ChatService = Depends(get_chat_service),
-                       ) -> PaginatedResponse:
-    return await message_service.get_chats_by_user_id(user.id, pagination.offset, pagination.limit)
+                       ) -> Response:
+    content = await message_service.get_chats_by_user_id(user.id, pagination.offset, pagination.limit)
+    return Response(content=content, media_type='application/json')
 
 
 @router.get('/chats_history/{chat_id}')
 async def get_chat_history(chat_id: int,
-                           pagination: Annotated[MessagePagination, Query()],
+                           pagination: Annotated[MessageHistoryPagination, Query()],
                            user: User = Depends(get_current_user),
                            message_service: ChatService = Depends(get_chat_service)
-                           ) -> PaginatedResponse:
+                           ) -> ChatHistoryResponse:
+    """Сообщения чата по курсору before_id/after_id; без курсора - последние."""
+    try:
+        return await message_service.get_chat_messages(user.id,
+                                                       chat_id,
+                                                       pagination.before_id,
+                                                       pagination.after_id,
+                                                       pagination.limit)
+    except ChatDoesNotExist as e:
+        raise HTTPException(status_code=404, detail=e.message)
+    except AccessError as e:
+        raise HTTPException(status_code=403, detail=e.message)
+
+
+@router.get('/chats_history/{chat_id}/since')
+async def get_chat_messages_since(chat_id: int,
+                                  pagination: Annotated[MessageResumePagination, Query()],
+                                  user: User = Depends(get_current_user),
+                                  message_service: ChatService = Depends(get_chat_service)
+                                  ) -> list[ChatMessage]:
+    """Сообщения чата после last_seq в порядке seq, для дозагрузки пропущенного после переподключения."""
     try:
-        return await message_service.get_chat_messages(user.id, chat_id, pagination.offset, pagination.limit)
+        return await message_service.get_messages_after(user.id, chat_id, pagination.last_seq, pagination.limit)
     except ChatDoesNotExist as e:
         raise HTTPException(status_code=404, detail=e.message)
     except AccessError as e:
@@ -67,7 +95,7 @@ async def delete_chat(chat_id: int,
                       message_service: ChatService = Depends(get_chat_service)
                       ) -> None:
     try:
-        await message_service.delete_chat(user.id, chat_id)
+        await message_service.delete_chat(chat_id, user.id)
     except ChatDoesNotExist as e:
         raise HTTPException(status_code=404, detail=e.message)
     except AccessError as e:
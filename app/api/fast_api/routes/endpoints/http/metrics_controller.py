@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends
+
+from app.domain.dto.metrics import CacheStats, WebsocketStats
+
+from app.services.core_services.metrics_service import MetricsService
+from app.dependencies.auth import get_current_superuser
+from app.dependencies.services.metrics import get_metrics_service
+
+router = APIRouter(prefix='/metrics', dependencies=[Depends(get_current_superuser)])
+
+
+@router.get('/cache')
+async def read_cache_stats(
+        metrics_service: MetricsService = Depends(get_metrics_service)
+        ) -> CacheStats:
+    """Попадания и промахи кеша по уровням для воркера, обработавшего запрос."""
+    return await metrics_service.get_cache_stats()
+
+
+@router.get('/websockets')
+async def read_websocket_stats(
+        metrics_service: MetricsService = Depends(get_metrics_service)
+        ) -> WebsocketStats:
+    """Очереди отправки и медленные получатели сокетов воркера, обработавшего запрос."""
+    return metrics_service.get_websocket_stats()
\ No newline at end of file
@@ -4,8 +4,9 @@ from typing import Annotated
 from app.domain.dto.user import UserDB
 from app.domain.dto.post import PostCreate, PostUpdate
 from app.domain.entities.post import Post
-from app.domain.dto.pagination import PaginatedResponse, PostPagination
-from app.domain.exceptions.base import AccessError
+from app.domain.dto.pagination import PaginatedResponse, CursorPaginatedResponse, PostPagination, \
+    PostSearchPagination, TrendingPagination
+from app.domain.exceptions.base import AccessError, InvalidCursorError
 from app.domain.exceptions.post import (
     PostCreateError,
     PostDoesNotExist,
@@ -14,21 +15,90 @@ from app.domain.exceptions.post import (
 )
 
 from app.services.core_services.post_service import PostService
-from app.dependencies.auth import get_current_active_user
+from app.services.core_services.trending_service import TrendingService
+from app.dependencies.auth import get_current_active_user, get_current_user_or_none
+from app.dependencies.etag import ETag
 from app.dependencies.services.post import get_post_service
+from app.dependencies.services.trending import get_trending_service
 
 router = APIRouter(prefix='/posts')
 
 
-@router.get('/')
+@router.get('/', dependencies=[Depends(ETag('posts'))])
 async def read_posts(
         pagination: Annotated[PostPagination, Query()],
         post_service: PostService = Depends(get_post_service)
-        ) -> PaginatedResponse:
-    """Получение списка постов с пагинацией."""
+        ) -> PaginatedResponse | CursorPaginatedResponse:
+    """Получение списка постов с пагинацией (offset или keyset при переданном cursor)."""
+    if pagination.cursor is not None:
+        try:
+            return await post_service.get_posts_by_cursor(pagination.cursor or None, pagination.limit)
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=e.message)
     return await post_service.get_all_posts(pagination.offset, pagination.limit)
 
 
+@router.get('/detailed')
+async def read_public_posts(
+        pagination: Annotated[PostPagination, Query()],
+        current_user: UserDB | None = Depends(get_current_user_or_none),
+        post_service: PostService = Depends(get_post_service)
+        ) -> CursorPaginatedResponse:
+    """Лента постов со счетчиками лайков и комментариев, изображениями и автором в одном запросе."""
+    try:
+        return await post_service.get_public_posts_by_cursor(
+            pagination.cursor or None,
+            pagination.limit,
+            current_user.id if current_user else None
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=e.message)
+
+
+@router.get('/search')
+async def search_posts(
+        pagination: Annotated[PostSearchPagination, Query()],
+        current_user: UserDB | None = Depends(get_current_user_or_none),
+        post_service: PostService = Depends(get_post_service)
+        ) -> CursorPaginatedResponse:
+    """Полнотекстовый поиск постов, отсортированный по релевантности."""
+    try:
+        return await post_service.search(
+            pagination.q,
+            pagination.cursor or None,
+            pagination.limit,
+            current_user.id if current_user else None
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=e.message)
+
+
+@router.get('/trending')
+async def read_trending_posts(
+        pagination: Annotated[TrendingPagination, Query()],
+        current_user: UserDB | None = Depends(get_current_user_or_none),
+        trending_service: TrendingService = Depends(get_trending_service)
+        ) -> PaginatedResponse:
+    """Популярные посты по рейтингу лайков и комментариев с затуханием во времени."""
+    return await trending_service.get_trending(
+        pagination.offset,
+        pagination.limit,
+        current_user.id if current_user else None
+    )
+
+
+@router.get('/{post_id}')
+async def read_post(
+        post_id: int,
+        post_service: PostService = Depends(get_post_service)
+        ) -> Post:
+    """Получение поста по ID."""
+    try:
+        return await post_service.get_post(post_id)
+    except PostDoesNotExist as e:
+        raise HTTPException(status_code=404, detail=e.message)
+
+
 @router.post('/')
 async def create_post(
         text_content: str = Body(...),
@@ -5,11 +5,12 @@ from app.domain.exceptions.user import UserDoesNotExist
 
 from app.services.core_services.profile_service import ProfileService
 from app.dependencies.services.profile import get_profile_service
+from app.dependencies.etag import ETag
 
 router = APIRouter(prefix='/profiles')
 
 
-@router.get('/{user_id}', response_model=ProfilePublic)
+@router.get('/{user_id}', response_model=ProfilePublic, dependencies=[Depends(ETag('profiles:{user_id}'))])
 async def get_profile(
     user_id: int,
     profile_service: ProfileService = Depends(get_profile_service)
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, Depends, Query, HTTPException, Response
 from typing import Annotated
 
 from app.domain.dto.pagination import LikePagination, PaginatedResponse
@@ -18,15 +18,16 @@ from app.infrastructure.database.models import User
 router = APIRouter(prefix='/subscriptions')
 
 
-@router.get('/{user_id}')
+@router.get('/{user_id}', response_model=PaginatedResponse)
 async def get_subscriptions_by_user_id(
         user_id: int,
         pagination: Annotated[LikePagination, Query()],
         service: SubscriptionService = Depends(get_subscription_service)
-        ) -> PaginatedResponse:
+        ) -> Response:
     """Получить список подписок пользователя."""
     try:
-        return await service.get_subscriptions_by_user_id(user_id, pagination.offset, pagination.limit)
+        content = await service.get_subscriptions_by_user_id(user_id, pagination.offset, pagination.limit)
+        return Response(content=content, media_type='application/json')
     except SubscriptionDoesNotExist as e:
         raise HTTPException(status_code=404, detail=e.message)
 
@@ -54,7 +55,7 @@ async def delete_subscription(
         ) -> None:
     """Удалить подписку по её ID."""
     try:
-        return await service.delete(subscription_id, current_user.id)
+        await service.delete(subscription_id, current_user.id)
     except SubscriptionDoesNotExist as e:
         raise HTTPException(status_code=404, detail=e.message)
     except SubscriptionDeleteError as e:
@@ -13,6 +13,7 @@ from app.domain.exceptions.user import (
 
 from app.services.core_services.user_service import UserService
 from app.dependencies.services.user import get_user_service
+from app.dependencies.etag import ETag
 
 router = APIRouter(prefix='/users')
 
@@ -40,7 +41,7 @@ async def read_users(
     return await service.get_all(pagination.offset, pagination.limit)
 
 
-@router.get('/{user_id}')
+@router.get('/{user_id}', dependencies=[Depends(ETag('users:{user_id}'))])
 async def read_user(
     user_id: Annotated[int, Path(gt=0)],
     service: UserService = Depends(get_user_service)
@@ -1,53 +1,221 @@
+import asyncio
+import json
+
 from fastapi import (
     APIRouter,
-    Depends,
     WebSocket,
     WebSocketDisconnect
 )
+from jwt.exceptions import InvalidTokenError
 
+from app.domain.exceptions.base import DomainError
 from app.domain.exceptions.chat import ChatDoesNotExist
 from app.domain.exceptions.user import UserDoesNotExist
 from app.domain.dto.chat import ChatMessageCreate
+from app.domain.entities.chat import ChatMessage
 
+from app.dependencies.redis import get_redis
 from app.dependencies.services.user import get_user_service
 from app.dependencies.services.chat import get_chat_service
 
-from app.services.core_services.chat_service import ChatService
-from app.services.core_services.user_service import UserService
-
-from app.api.fast_api.routes.endpoints.websockets.manager import websocket_manager
+from app.services.background.message_writer import chat_message_writer
+from app.services.websockets.manager import Connection, websocket_manager
+from app.infrastructure.database.database import AsyncSessionLocal
+from app.infrastructure.database.redis import RedisClient
+from app.infrastructure.settings.config import CHAT_MESSAGE_GUARANTEE, CHAT_REPLAY_LIMIT
 
 router = APIRouter()
+# ссылки на задачи подтверждений, чтобы их не собрал сборщик мусора
+_ack_tasks: set[asyncio.Task] = set()
 
 
-@router.websocket('/')
-async def send_message(websocket: WebSocket,
-                       user_service: UserService = Depends(get_user_service),
-                       message_service: ChatService = Depends(get_chat_service)):
+async def _authenticate(token: str) -> int | None:
+    """Проверяет токен и возвращает id пользователя.
+
+    Сессия БД живет только на время проверки: Depends(get_db) держал бы соединение пула,
+    пока открыт сокет. Сообщения сохраняет chat_message_writer в своих сессиях.
+    """
+    async with AsyncSessionLocal() as session:
+        user_service = get_user_service(session, await get_redis())
+        try:
+            user = await user_service._get_by_token(token)
+        except (UserDoesNotExist, InvalidTokenError, ValueError):
+            return None
+        return user.id
+
+
+async def _is_member(user_id: int, chat_id: int) -> bool:
+    async with AsyncSessionLocal() as session:
+        chat_service = await get_chat_service(session, await get_redis(), RedisClient.get_redis())
+        try:
+            return await chat_service.is_user_chat(user_id, chat_id)
+        except ChatDoesNotExist:
+            return False
+
+
+async def _replay(connection: Connection, chat_id: int, last_seq: int) -> None:
+    """Досылает сообщения, пропущенные клиентом после last_seq; при has_more клиент дочитывает историю по HTTP."""
+    async with AsyncSessionLocal() as session:
+        chat_service = await get_chat_service(session, await get_redis(), RedisClient.get_redis())
+        messages = await chat_service.replay(chat_id, last_seq, CHAT_REPLAY_LIMIT)
+    await websocket_manager.send(connection, {
+        "type": "replay",
+        "chat_id": chat_id,
+        "messages": [message.model_dump(mode='json') for message in messages],
+        "has_more": len(messages) == CHAT_REPLAY_LIMIT
+    })
+
+
+async def _acknowledge(connection: Connection, chat_id: int, saved: asyncio.Future) -> ChatMessage | None:
+    """Дожидается сохранения сообщения и отправляет отправителю ack с id или ошибку."""
+    try:
+        message = await saved
+    except ChatDoesNotExist as e:
+        await websocket_manager.unsubscribe(connection, chat_id)
+        await websocket_manager.send(connection, {"type": "error", "chat_id": chat_id, "detail": e.message})
+        return None
+    except DomainError as e:
+        await websocket_manager.send(connection, {"type": "error", "chat_id": chat_id, "detail": e.message})
+        return None
+
+    await websocket_manager.send(connection, {
+        "type": "ack",
+        "id": message.id,
+        "seq": message.seq,
+        "chat_id": chat_id,
+        "created_at": message.created_at.isoformat()
+    })
+    return message
+
+
+async def _send_chat_message(connection: Connection, chat_id: int, text: str) -> None:
+    message = ChatMessageCreate(chat_id=chat_id,
+                                sender_id=connection.user_id,
+                                text=text)
+    try:
+        saved = chat_message_writer.submit(message)
+    except DomainError as e:
+        await websocket_manager.send(connection, {"type": "error", "chat_id": chat_id, "detail": e.message})
+        return
+
+    if CHAT_MESSAGE_GUARANTEE == 'fast':
+        await websocket_manager.broadcast(text, chat_id, connection.user_id)
+        task = asyncio.create_task(_acknowledge(connection, chat_id, saved))
+        _ack_tasks.add(task)
+        task.add_done_callback(_ack_tasks.discard)
+        return
+
+    saved_message = await _acknowledge(connection, chat_id, saved)
+    if saved_message is not None:
+        await websocket_manager.broadcast(saved_message.text, chat_id, connection.user_id,
+                                          saved_message.id, saved_message.seq)
+
+
+async def _handle_frame(connection: Connection, frame: dict) -> None:
+    frame_type = frame.get('type')
+    chat_id = frame.get('chat_id')
+    if not isinstance(chat_id, int):
+        await websocket_manager.send(connection, {"type": "error", "detail": "chat_id is required"})
+        return
+
+    if frame_type == 'subscribe':
+        # участие проверяется один раз и запоминается в подписках сокета
+        if chat_id not in connection.chats and not await _is_member(connection.user_id, chat_id):
+            await websocket_manager.send(connection, {"type": "error", "chat_id": chat_id,
+                                                      "detail": "You have not access to this chat"})
+            return
+        await websocket_manager.subscribe(connection, chat_id)
+        await websocket_manager.send(connection, {"type": "subscribed", "chat_id": chat_id})
+        # подписка оформляется до досылки: новые сообщения не потеряются, повторы клиент отбросит по seq
+        last_seq = frame.get('last_seq')
+        if last_seq is None:
+            return
+        if CHAT_MESSAGE_GUARANTEE != 'persisted':
+            # в режиме fast рассылка идет до сохранения и без seq: клиенту не с чего продолжать
+            await websocket_manager.send(connection, {"type": "error", "chat_id": chat_id,
+                                                      "detail": "last_seq is not supported by this server"})
+        elif isinstance(last_seq, int) and last_seq >= 0:
+            await _replay(connection, chat_id, last_seq)
+    elif frame_type == 'unsubscribe':
+        await websocket_manager.unsubscribe(connection, chat_id)
+        await websocket_manager.send(connection, {"type": "unsubscribed", "chat_id": chat_id})
+    elif frame_type == 'message':
+        text = frame.get('text')
+        if chat_id not in connection.chats:
+            await websocket_manager.send(connection, {"type": "error", "chat_id": chat_id,
+                                                      "detail": "Subscribe to the chat first"})
+        elif not isinstance(text, str) or not text:
+            await websocket_manager.send(connection, {"type": "error", "chat_id": chat_id,
+                                                      "detail": "text is required"})
+        else:
+            await _send_chat_message(connection, chat_id, text)
+    else:
+        await websocket_manager.send(connection, {"type": "error", "detail": f"Unknown frame type: {frame_type}"})
+
+
+@router.websocket('/ws')
+async def user_socket(websocket: WebSocket):
+    """Один сокет пользователя на все его чаты.
+
+    Клиент отправляет JSON-кадры {"type": "subscribe" | "unsubscribe", "chat_id": ...}
+    и {"type": "message", "chat_id": ..., "text": ...}; сообщения чатов приходят с chat_id и seq.
+    В subscribe можно передать last_seq, чтобы получить пропущенные сообщения кадром replay;
+    это доступно только при CHAT_MESSAGE_GUARANTEE='persisted', в режиме fast рассылка идет без seq.
+    """
     token = websocket.query_params.get("token")
-    chat_id = int(websocket.query_params.get("chat_id"))
-    if not token or not chat_id:
+    user_id = await _authenticate(token) if token else None
+    if user_id is None:
         await websocket.close(code=1008)
         return
 
+    connection = await websocket_manager.connect(websocket, user_id)
     try:
-        user = await user_service._get_by_token(token)
-    except UserDoesNotExist:
+        while True:
+            data = await websocket.receive_text()
+            try:
+                frame = json.loads(data)
+            except ValueError:
+                frame = None
+            if not isinstance(frame, dict):
+                await websocket_manager.send(connection, {"type": "error", "detail": "Frame must be a JSON object"})
+                continue
+            await _handle_frame(connection, frame)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        await websocket_manager.disconnect(connection)
+
+
+@router.websocket('/')
+async def send_message(websocket: WebSocket):
+    """Сокет одного чата: кадры - текст сообщений. Оставлен для старых клиентов, новым следует использовать /ws."""
+    token = websocket.query_params.get("token")
+    chat_id = websocket.query_params.get("chat_id")
+    last_seq = websocket.query_params.get("last_seq")
+    if not token or not chat_id or not chat_id.isdigit() or (last_seq and not last_seq.isdigit()):
         await websocket.close(code=1008)
         return
+    chat_id = int(chat_id)
 
-    await websocket_manager.connect(websocket, chat_id, user.id)
+    # пользователь и доступ к чату проверяются один раз на все время соединения
+    user_id = await _authenticate(token)
+    if user_id is None or not await _is_member(user_id, chat_id):
+        await websocket.close(code=1008)
+        return
 
+    connection = await websocket_manager.connect(websocket, user_id)
+    await websocket_manager.subscribe(connection, chat_id)
+    if last_seq and CHAT_MESSAGE_GUARANTEE == 'persisted':
+        await _replay(connection, chat_id, int(last_seq))
     try:
         while True:
             data = await websocket.receive_text()
-            await websocket_manager.broadcast(data, chat_id, user.id)
-            message = ChatMessageCreate(chat_id=chat_id,
-                                        sender_id=user.id,
-                                        text=data)
-            try:
-                await message_service.create_message(message)
-            except ChatDoesNotExist:
-                await websocket.close(code=1008)
+            if chat_id not in connection.chats:
+                # чат удален, пока сокет был открыт
+                await websocket_manager.disconnect(connection, 1008)
+                break
+            await _send_chat_message(connection, chat_id, data)
     except WebSocketDisconnect:
-        websocket_manager.disconnect(chat_id, user.id)
+        pass
+    finally:
+        await websocket_manager.disconnect(connection)
\ No newline at end of file
@@ -2,7 +2,7 @@ import logging
 from fastapi import APIRouter, FastAPI
 
 from .endpoints.http import profile_controller, image_controller, post_controller, user_controller, auth_controller, \
-    comment_controller, like_controller, subscription_controller, messages_controller
+    comment_controller, like_controller, subscription_controller, messages_controller, feed_controller, metrics_controller
 from .endpoints.websockets import messages
 from app.infrastructure.settings.config import BASE_URL
 
@@ -17,6 +17,8 @@ def include_routers(router: APIRouter):
         router.include_router(subscription_controller.router, tags=['subscriptions'])
         router.include_router(profile_controller.router, tags=['profiles'])
         router.include_router(messages_controller.router, tags=['messages'])
+        router.include_router(feed_controller.router, tags=['feed'])
+        router.include_router(metrics_controller.router, tags=['metrics'])
     except Exception as e:
         logging.error(f"Failed to configure routers: {e}")
 
@@ -46,5 +48,6 @@ def setup_routers(app: FastAPI):
         prefix="/messages"
     )
     ws_router.include_router(messages.router)
+    app.include_router(ws_router)
 
     logging.info(f'All routers are configured on {BASE_URL}/docs')
\ No newline at end of file
@@ -5,12 +5,14 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 
 from app.domain.dto.user import UserDB
+from app.domain.exceptions.user import UserDoesNotExist
 from app.dependencies.services.user import get_user_service
 from app.services.core_services.user_service import UserService
 from app.infrastructure.settings.config import AUTH_KEY, HASHING_ALGORITHM
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token", auto_error=False)
 
 
 async def get_current_user(
@@ -30,13 +32,30 @@ async def get_current_user(
     except InvalidTokenError:
         raise credentials_exception
 
-    user = await service._get_by_email(email)
-    if user is None:
+    try:
+        return await service._get_by_email(email)
+    except UserDoesNotExist:
         raise credentials_exception
-    return user
 
 
 async def get_current_active_user(
         current_user: Annotated[UserDB, Depends(get_current_user)],
 ) -> UserDB:
+    return current_user
+
+
+async def get_current_user_or_none(
+        token: Annotated[str | None, Depends(optional_oauth2_scheme)],
+        service: UserService = Depends(get_user_service)
+) -> UserDB | None:
+    if token is None:
+        return None
+    return await get_current_user(token, service)
+
+
+async def get_current_superuser(
+        current_user: Annotated[UserDB, Depends(get_current_active_user)],
+) -> UserDB:
+    if not current_user.is_superuser:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Superuser rights required")
     return current_user
\ No newline at end of file
@@ -0,0 +1,37 @@
+import hashlib
+
+from fastapi import Depends, HTTPException, Request, Response
+
+from app.dependencies.redis import get_redis_client
+from app.infrastructure.database.repositories.version_repository import VersionRepository
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    # слабое сравнение по RFC 9110: префикс W/ не учитывается
+    tags = {tag.strip().removeprefix('W/') for tag in if_none_match.split(',')}
+    return '*' in tags or etag.removeprefix('W/') in tags
+
+
+class ETag:
+    """Условный GET: ETag строится из версии данных в Redis без выполнения запроса к БД.
+
+    namespace может ссылаться на параметры пути, например 'comments:{post_id}'.
+    """
+
+    def __init__(self, namespace: str):
+        self.namespace = namespace
+
+    async def __call__(self, request: Request, response: Response, redis=Depends(get_redis_client)) -> None:
+        namespace = self.namespace.format(**request.path_params)
+        version = await VersionRepository(redis).get(namespace)
+        if version is None:
+            return
+
+        digest = hashlib.blake2b(f'{version}:{request.url.path}?{request.url.query}'.encode(), digest_size=8)
+        etag = f'W/"{digest.hexdigest()}"'
+        headers = {'ETag': etag, 'Cache-Control': 'no-cache'}
+
+        if_none_match = request.headers.get('if-none-match')
+        if if_none_match and _matches(if_none_match, etag):
+            raise HTTPException(status_code=304, headers=headers)
+        response.headers.update(headers)
\ No newline at end of file
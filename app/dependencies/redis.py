@@ -1,8 +1,13 @@
+from redis.asyncio import Redis
+
 from app.infrastructure.database.redis import RedisClient
 from app.infrastructure.database.repositories.redis_repository import RedisRepository
 
 
 async def get_redis() -> RedisRepository:
+    return RedisRepository(RedisClient.get_binary_redis())
+
+
+async def get_redis_client() -> Redis:
     client = RedisClient()
-    redis = await client.get_redis()
-    return RedisRepository(redis)
\ No newline at end of file
+    return await client.get_redis()
\ No newline at end of file
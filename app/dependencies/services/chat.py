@@ -1,13 +1,17 @@
 from fastapi import Depends
 
-from app.dependencies.redis import get_redis
+from app.dependencies.redis import get_redis, get_redis_client
 from app.services.core_services.chat_service import ChatService
 from app.infrastructure.database.repositories.chat_repository import ChatRepository
 from app.infrastructure.database.repositories.chat_message_repository import ChatMessageRepository
+from app.infrastructure.database.repositories.recent_messages_repository import RecentMessagesRepository
 from app.dependencies.db import get_db
 
 
-async def get_chat_service(db=Depends(get_db), cache=Depends(get_redis)) -> ChatService:
+async def get_chat_service(db=Depends(get_db),
+                           cache=Depends(get_redis),
+                           redis=Depends(get_redis_client)) -> ChatService:
     chat_repo = ChatRepository(db)
     chat_message_repo = ChatMessageRepository(db)
-    return ChatService(chat_repo, chat_message_repo, cache)
\ No newline at end of file
+    recent_messages_repo = RecentMessagesRepository(redis)
+    return ChatService(chat_repo, chat_message_repo, cache, recent_messages_repo)
\ No newline at end of file
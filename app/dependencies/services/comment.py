@@ -1,10 +1,17 @@
 from fastapi import Depends
 
+from app.dependencies.redis import get_redis_client
 from app.services.core_services.comment_service import CommentService
 from app.infrastructure.database.repositories.comment_repository import CommentRepository
+from app.infrastructure.database.repositories.counter_repository import CounterRepository
+from app.infrastructure.database.repositories.trending_repository import TrendingRepository
+from app.infrastructure.database.repositories.version_repository import VersionRepository
 from app.dependencies.db import get_db
 
 
-def get_comment_service(db=Depends(get_db)) -> CommentService:
+async def get_comment_service(db=Depends(get_db), redis=Depends(get_redis_client)) -> CommentService:
     comment_repo = CommentRepository(db)
-    return CommentService(comment_repo)
\ No newline at end of file
+    counter_repo = CounterRepository(redis)
+    trending_repo = TrendingRepository(redis)
+    version_repo = VersionRepository(redis)
+    return CommentService(comment_repo, counter_repo, trending_repo, version_repo)
\ No newline at end of file
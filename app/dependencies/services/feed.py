@@ -0,0 +1,16 @@
+from fastapi import Depends
+
+from app.dependencies.redis import get_redis_client
+from app.dependencies.services.public_post import get_public_post_service
+from app.services.core_services.feed_service import FeedService
+from app.infrastructure.database.repositories.feed_repository import FeedRepository
+from app.infrastructure.database.repositories.subscription_repository import SubscriptionRepository
+from app.dependencies.db import get_db
+
+
+async def get_feed_service(db=Depends(get_db),
+                           redis=Depends(get_redis_client),
+                           public_post_service=Depends(get_public_post_service)) -> FeedService:
+    feed_repo = FeedRepository(redis)
+    subscription_repo = SubscriptionRepository(db)
+    return FeedService(feed_repo, subscription_repo, public_post_service)
\ No newline at end of file
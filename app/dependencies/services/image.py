@@ -1,10 +1,11 @@
 from fastapi import Depends
 
+from app.dependencies.redis import get_redis
 from app.services.core_services.image_service import ImageService
 from app.infrastructure.database.repositories.image_repository import ImageRepository
 from app.dependencies.db import get_db
 
 
-def get_image_service(db=Depends(get_db)) -> ImageService:
+async def get_image_service(db=Depends(get_db), cache=Depends(get_redis)) -> ImageService:
     image_repo = ImageRepository(db)
-    return ImageService(image_repo)
\ No newline at end of file
+    return ImageService(image_repo, cache)
\ No newline at end of file
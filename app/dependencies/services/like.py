@@ -1,10 +1,17 @@
 from fastapi import Depends
 
+from app.dependencies.redis import get_redis_client
 from app.services.core_services.like_service import LikeService
 from app.infrastructure.database.repositories.like_repository import LikeRepository
+from app.infrastructure.database.repositories.counter_repository import CounterRepository
+from app.infrastructure.database.repositories.like_status_repository import LikeStatusRepository
+from app.infrastructure.database.repositories.trending_repository import TrendingRepository
 from app.dependencies.db import get_db
 
 
-def get_like_service(db=Depends(get_db)) -> LikeService:
+async def get_like_service(db=Depends(get_db), redis=Depends(get_redis_client)) -> LikeService:
     like_repo = LikeRepository(db)
-    return LikeService(like_repo)
\ No newline at end of file
+    counter_repo = CounterRepository(redis)
+    like_status_repo = LikeStatusRepository(redis)
+    trending_repo = TrendingRepository(redis)
+    return LikeService(like_repo, counter_repo, like_status_repo, trending_repo)
\ No newline at end of file
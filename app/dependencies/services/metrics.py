@@ -0,0 +1,9 @@
+from fastapi import Depends
+
+from app.dependencies.redis import get_redis
+from app.services.core_services.metrics_service import MetricsService
+from app.services.websockets.manager import websocket_manager
+
+
+async def get_metrics_service(cache=Depends(get_redis)) -> MetricsService:
+    return MetricsService(cache, websocket_manager)
\ No newline at end of file
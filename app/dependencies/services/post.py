@@ -1,10 +1,21 @@
 from fastapi import Depends
 
+from app.dependencies.redis import get_redis_client, get_redis
 from app.services.core_services.post_service import PostService
 from app.infrastructure.database.repositories.post_repository import PostRepository
+from app.infrastructure.database.repositories.subscription_repository import SubscriptionRepository
+from app.infrastructure.database.repositories.feed_repository import FeedRepository
+from app.infrastructure.database.repositories.trending_repository import TrendingRepository
+from app.infrastructure.database.repositories.version_repository import VersionRepository
 from app.dependencies.db import get_db
 
 
-def get_post_service(db=Depends(get_db)) -> PostService:
+async def get_post_service(db=Depends(get_db),
+                           redis=Depends(get_redis_client),
+                           cache=Depends(get_redis)) -> PostService:
     post_repo = PostRepository(db)
-    return PostService(post_repo)
\ No newline at end of file
+    subscription_repo = SubscriptionRepository(db)
+    feed_repo = FeedRepository(redis)
+    trending_repo = TrendingRepository(redis)
+    version_repo = VersionRepository(redis)
+    return PostService(post_repo, subscription_repo, feed_repo, trending_repo, version_repo, cache)
\ No newline at end of file
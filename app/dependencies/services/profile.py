@@ -1,10 +1,11 @@
 from fastapi import Depends
 
+from app.dependencies.redis import get_redis
 from app.services.core_services.profile_service import ProfileService
 from app.infrastructure.database.repositories.profile_repository import ProfileRepository
 from app.dependencies.db import get_db
 
 
-def get_profile_service(db=Depends(get_db)) -> ProfileService:
+def get_profile_service(db=Depends(get_db), cache=Depends(get_redis)) -> ProfileService:
     profile_repo = ProfileRepository(db)
-    return ProfileService(profile_repo)
\ No newline at end of file
+    return ProfileService(profile_repo, cache)
\ No newline at end of file
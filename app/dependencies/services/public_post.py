@@ -0,0 +1,13 @@
+from fastapi import Depends
+
+from app.dependencies.redis import get_redis
+from app.services.core_services.public_post_service import PublicPostService
+from app.infrastructure.database.repositories.post_repository import PostRepository
+from app.infrastructure.database.repositories.like_repository import LikeRepository
+from app.dependencies.db import get_db
+
+
+async def get_public_post_service(db=Depends(get_db), cache=Depends(get_redis)) -> PublicPostService:
+    post_repo = PostRepository(db)
+    like_repo = LikeRepository(db)
+    return PublicPostService(post_repo, like_repo, cache)
\ No newline at end of file
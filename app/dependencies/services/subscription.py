@@ -1,11 +1,15 @@
 from fastapi import Depends
 
-from app.dependencies.redis import get_redis
+from app.dependencies.redis import get_redis, get_redis_client
 from app.services.core_services.subscription_service import SubscriptionService
 from app.infrastructure.database.repositories.subscription_repository import SubscriptionRepository
+from app.infrastructure.database.repositories.version_repository import VersionRepository
 from app.dependencies.db import get_db
 
 
-async def get_subscription_service(db=Depends(get_db), cache=Depends(get_redis)) -> SubscriptionService:
+async def get_subscription_service(db=Depends(get_db),
+                                   cache=Depends(get_redis),
+                                   redis=Depends(get_redis_client)) -> SubscriptionService:
     repository = SubscriptionRepository(db)
-    return SubscriptionService(repository, cache)
\ No newline at end of file
+    version_repo = VersionRepository(redis)
+    return SubscriptionService(repository, cache, version_repo)
\ No newline at end of file
@@ -0,0 +1,12 @@
+from fastapi import Depends
+
+from app.dependencies.redis import get_redis_client
+from app.dependencies.services.public_post import get_public_post_service
+from app.services.core_services.trending_service import TrendingService
+from app.infrastructure.database.repositories.trending_repository import TrendingRepository
+
+
+async def get_trending_service(redis=Depends(get_redis_client),
+                               public_post_service=Depends(get_public_post_service)) -> TrendingService:
+    trending_repo = TrendingRepository(redis)
+    return TrendingService(trending_repo, public_post_service)
\ No newline at end of file
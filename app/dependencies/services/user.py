@@ -1,11 +1,12 @@
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.dependencies.redis import get_redis
 from app.services.core_services.user_service import UserService
 from app.infrastructure.database.repositories.user_repository import UserRepository
 from app.dependencies.db import get_db
 
 
-def get_user_service(db: AsyncSession = Depends(get_db)) -> UserService:
+def get_user_service(db: AsyncSession = Depends(get_db), cache=Depends(get_redis)) -> UserService:
     user_repo = UserRepository(db)
-    return UserService(user_repo)
\ No newline at end of file
+    return UserService(user_repo, cache)
\ No newline at end of file
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
 
 
@@ -10,3 +10,14 @@ class LikeCreate(LikeBase):
     pass
 
 
+class LikeStatusRequest(BaseModel):
+    post_ids: list[int] = Field(min_length=1, max_length=100, description="ID постов для проверки")
+
+
+class LikeStatus(BaseModel):
+    post_ids: list[int] = Field(description="ID постов, которые лайкнул текущий пользователь")
+
+
+class LikeState(BaseModel):
+    post_id: int
+    liked: bool
@@ -0,0 +1,22 @@
+from pydantic import BaseModel, Field
+
+
+class CacheTierStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+
+
+class CacheStats(BaseModel):
+    local: CacheTierStats = Field(description="In-process LRU текущего воркера")
+    redis: CacheTierStats = Field(description="Обращения к Redis после промаха локального кеша")
+    local_size: int = Field(description="Количество записей в локальном кеше")
+
+
+class WebsocketStats(BaseModel):
+    connections: int = Field(description="Открытые сокеты текущего воркера")
+    users: int = Field(description="Пользователи с открытыми сокетами")
+    chats: int = Field(description="Чаты, на которые подписан хотя бы один сокет")
+    queued: int = Field(description="Сообщения в очередях отправки всех сокетов")
+    max_queue_depth: int = Field(description="Длина самой длинной очереди отправки")
+    dropped: int = Field(description="Сообщения, пропущенные из-за переполненной очереди")
+    slow_disconnects: int = Field(description="Сокеты, закрытые из-за переполненной очереди")
\ No newline at end of file
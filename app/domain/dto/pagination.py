@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl, model_validator
 from typing import Optional
 
 
@@ -10,6 +10,23 @@ class UsersPagination(BaseModel):
 class PostPagination(BaseModel):
     offset: int = Field(default=0, ge=0, description="Смещение от начала списка")
     limit: int = Field(default=5, gt=0, le=100, description="Количество элементов на странице")
+    cursor: Optional[str] = Field(default=None, description="Курсор keyset-пагинации; пустая строка - первая страница")
+
+
+class PostSearchPagination(BaseModel):
+    q: str = Field(min_length=1, max_length=256, description="Поисковый запрос")
+    cursor: Optional[str] = Field(default=None, description="Курсор следующей страницы результатов")
+    limit: int = Field(default=10, gt=0, le=100, description="Количество элементов на странице")
+
+
+class TrendingPagination(BaseModel):
+    offset: int = Field(default=0, ge=0, description="Смещение от начала списка")
+    limit: int = Field(default=10, gt=0, le=100, description="Количество элементов на странице")
+
+
+class FeedPagination(BaseModel):
+    cursor: Optional[str] = Field(default=None, description="Курсор следующей страницы ленты")
+    limit: int = Field(default=10, gt=0, le=100, description="Количество элементов на странице")
 
 
 class CommentPagination(BaseModel):
@@ -27,8 +44,37 @@ class MessagePagination(BaseModel):
     limit: int = Field(default=20, gt=0, le=100, description="Количество элементов на странице")
 
 
+class MessageHistoryPagination(BaseModel):
+    before_id: Optional[int] = Field(default=None, gt=0, description="Сообщения старше сообщения с этим id")
+    after_id: Optional[int] = Field(default=None, ge=0, description="Сообщения новее сообщения с этим id")
+    limit: int = Field(default=20, gt=0, le=100, description="Количество элементов на странице")
+
+    @model_validator(mode='after')
+    def check_single_cursor(self) -> 'MessageHistoryPagination':
+        if self.before_id is not None and self.after_id is not None:
+            raise ValueError("before_id and after_id cannot be used together")
+        return self
+
+
+class MessageResumePagination(BaseModel):
+    last_seq: int = Field(ge=0, description="Номер последнего полученного сообщения чата")
+    limit: int = Field(default=100, gt=0, le=100, description="Количество сообщений")
+
+
 class PaginatedResponse(BaseModel):
     count: int = Field(description="Количество записей", examples=[30])
     prev: Optional[HttpUrl] = Field(default=None, description="url предыдущей страницы", examples=['https://interesly.com/api/v1/users?offset=<page-1>&limit=<limit>'])
     next: Optional[HttpUrl] = Field(default=None, description="url следующей страницы",  examples=['https://interesly.com/api/v1/users?offset=<page+1>&limit=<limit>'])
-    results: Optional[list] = Field(default=[], description='Записи',  examples=[['some_objects']]) 
\ No newline at end of file
+    results: Optional[list] = Field(default=[], description='Записи',  examples=[['some_objects']]) 
+
+
+class CursorPaginatedResponse(BaseModel):
+    next_cursor: Optional[str] = Field(default=None, description="Курсор следующей страницы")
+    next: Optional[HttpUrl] = Field(default=None, description="url следующей страницы", examples=['https://interesly.com/api/v1/posts?cursor=<cursor>&limit=<limit>'])
+    results: Optional[list] = Field(default=[], description='Записи',  examples=[['some_objects']])
+
+
+class ChatHistoryResponse(BaseModel):
+    prev: Optional[HttpUrl] = Field(default=None, description="url более старых сообщений", examples=['https://interesly.com/api/v1/messages/chats_history/1?before_id=<id>&limit=<limit>'])
+    next: Optional[HttpUrl] = Field(default=None, description="url более новых сообщений", examples=['https://interesly.com/api/v1/messages/chats_history/1?after_id=<id>&limit=<limit>'])
+    results: list = Field(default=[], description='Сообщения в порядке отправки', examples=[['some_objects']])
\ No newline at end of file
@@ -2,6 +2,8 @@ from pydantic import BaseModel
 from datetime import datetime
 from typing import Optional
 
+from app.domain.entities.post import Post
+
 
 class PostBase(BaseModel):
     text_content: str
@@ -16,3 +18,22 @@ class PostCreate(PostBase):
 
 class PostUpdate(PostBase):
     id: int
+
+
+class PostPublic(Post):
+    author_username: str
+    likes_count: int
+    comments_count: int
+    images: list[str]
+    liked_by_me: bool
+
+
+class PostImportError(BaseModel):
+    line: int
+    error: str
+    row: str
+
+
+class PostImportReport(BaseModel):
+    imported: int = 0
+    errors: list[PostImportError] = []
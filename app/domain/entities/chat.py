@@ -15,7 +15,8 @@ class Chat(BaseModel):
 class ChatMessage(BaseModel):
     id: int
     chat_id: int
-    user_id: int
+    sender_id: int
+    seq: int
     text: str
     created_at: datetime
     updated_at: datetime
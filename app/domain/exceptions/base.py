@@ -5,4 +5,8 @@ class DomainError(Exception):
 
 
 class AccessError(DomainError):
+    pass
+
+
+class InvalidCursorError(DomainError):
     pass
\ No newline at end of file
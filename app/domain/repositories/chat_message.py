@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 
 from app.domain.entities.chat import ChatMessage
 from app.domain.dto.chat import ChatMessageCreate
-from app.domain.dto.pagination import PaginatedResponse
+from app.domain.dto.pagination import ChatHistoryResponse
 from app.domain.dto.chat import ChatMessageUpdate
 
 
@@ -12,7 +12,21 @@ class IChatMessage(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def get_by_chat_id(self, chat_id: int, offset: int, limit: int) -> PaginatedResponse:
+    async def save_many(self, messages: list[ChatMessageCreate]) -> list[ChatMessage]:
+        """Сохраняет пачку сообщений одним INSERT; результат в порядке messages."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_history(self,
+                          chat_id: int,
+                          before_id: int | None,
+                          after_id: int | None,
+                          limit: int) -> ChatHistoryResponse:
+        """Страница истории по курсору на id; без курсора - последние сообщения."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_after_seq(self, chat_id: int, seq: int, limit: int) -> list[ChatMessage]:
         raise NotImplementedError
 
     @abstractmethod
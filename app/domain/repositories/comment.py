@@ -19,5 +19,5 @@ class IComment(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def delete(self, comment_id: int, current_user_id: int) -> None:
+    async def delete(self, comment_id: int, current_user_id: int) -> Comment:
         raise NotImplementedError
\ No newline at end of file
@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+
+
+class ICounter(ABC):
+    @abstractmethod
+    async def incr(self, post_id: int, likes: int = 0, comments: int = 0) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def acquire_flush_lock(self) -> str | None:
+        """Возвращает токен владельца блокировки или None, если сброс уже выполняет другой воркер."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def release_flush_lock(self, token: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def take_pending(self) -> dict[int, dict[str, int]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def ack_pending(self) -> None:
+        raise NotImplementedError
@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+
+from app.domain.dto.pagination import CursorPaginatedResponse
+
+
+class IFeed(ABC):
+    @abstractmethod
+    async def push(self, post_id: int, user_ids: list[int]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_post_ids(self, user_id: int, cursor: str | None, limit: int) -> list[int]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def push_celebrity(self, post_id: int, user_id: int) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def filter_celebrity_ids(self, user_ids: list[int]) -> list[int]:
+        """Оставляет пользователей, чьи посты подмешиваются в ленты при чтении; при ошибке - пустой список."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_celebrity_post_ids(self, user_ids: list[int], cursor: str | None, limit: int) -> list[list[int]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_page(self, post_ids: list[int], limit: int) -> CursorPaginatedResponse:
+        """Страница ленты с курсором следующей страницы; results - переданные id постов."""
+        raise NotImplementedError
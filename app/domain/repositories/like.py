@@ -9,10 +9,18 @@ class ILike(ABC):
     async def save(self, post_id: int, current_user_id: int) -> Like:
         raise NotImplementedError
 
+    @abstractmethod
+    async def like(self, post_id: int, current_user_id: int) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def unlike(self, post_id: int, current_user_id: int) -> bool:
+        raise NotImplementedError
+
     @abstractmethod
     async def get_all_by_post_id(self, post_id: int, offset: int, limit: int) -> PaginatedResponse:
         raise NotImplementedError
 
     @abstractmethod
-    async def delete(self, like_id: int, current_user_id: int) -> None:
+    async def get_liked_post_ids(self, user_id: int, post_ids: list[int]) -> list[int]:
         raise NotImplementedError
\ No newline at end of file
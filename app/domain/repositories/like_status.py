@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+
+
+class ILikeStatus(ABC):
+    @abstractmethod
+    async def get(self, user_id: int, post_ids: list[int]) -> dict[int, bool]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, user_id: int, statuses: dict[int, bool]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def fill(self, user_id: int, statuses: dict[int, bool]) -> None:
+        """Дописывает прочитанные из БД отметки, не перезаписывая уже записанные лайком или отменой."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def clear(self, user_id: int) -> None:
+        raise NotImplementedError
\ No newline at end of file
@@ -1,8 +1,8 @@
 from abc import ABC, abstractmethod
 
-from app.domain.dto.pagination import PaginatedResponse
+from app.domain.dto.pagination import PaginatedResponse, CursorPaginatedResponse
 from app.domain.entities.post import Post
-from app.domain.dto.post import PostCreate, PostUpdate
+from app.domain.dto.post import PostCreate, PostUpdate, PostPublic
 
 
 class IPost(ABC):
@@ -10,14 +10,46 @@ class IPost(ABC):
     async def save(self, post: PostCreate) -> Post:
         raise NotImplementedError
 
+    @abstractmethod
+    async def bulk_save(self, posts: list[PostCreate]) -> int:
+        raise NotImplementedError
+
     @abstractmethod
     async def get_all_posts(self, offset: int, limit: int) -> PaginatedResponse:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_posts_by_cursor(self, cursor: str | None, limit: int) -> CursorPaginatedResponse:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_public_posts_by_cursor(self,
+                                         cursor: str | None,
+                                         limit: int,
+                                         current_user_id: int | None) -> CursorPaginatedResponse:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_public_by_ids(self, post_ids: list[int], current_user_id: int | None) -> list[PostPublic]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def search(self,
+                     query: str,
+                     cursor: str | None,
+                     limit: int,
+                     current_user_id: int | None) -> CursorPaginatedResponse:
+        raise NotImplementedError
+
     @abstractmethod
     async def get_post(self, post_id: int) -> Post:
         raise NotImplementedError
 
+    @abstractmethod
+    async def refresh_counters(self, post_ids: list[int]) -> None:
+        """Пересчитывает likes_count и comments_count постов по таблицам лайков и комментариев."""
+        raise NotImplementedError
+
     @abstractmethod
     async def delete(self, post_id: int, current_user_id: int) -> None:
         raise NotImplementedError
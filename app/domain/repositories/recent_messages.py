@@ -0,0 +1,39 @@
+from abc import ABC, abstractmethod
+
+from app.domain.dto.pagination import ChatHistoryResponse
+from app.domain.entities.chat import ChatMessage
+
+
+class IRecentMessages(ABC):
+    @abstractmethod
+    async def push(self, messages: list[ChatMessage]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def fill(self, chat_id: int, messages: list[ChatMessage], first_seq: int) -> None:
+        """Сохраняет полную страницу из БД: пропуски номеров от first_seq считаются удаленными сообщениями."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_after(self, chat_id: int, seq: int, limit: int) -> list[ChatMessage] | None:
+        """Сообщения с номером больше seq; None, если буфер не покрывает весь промежуток."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_latest(self, chat_id: int, limit: int) -> ChatHistoryResponse | None:
+        """Последние сообщения чата; None, если буфер не содержит их все."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def replace(self, message: ChatMessage) -> None:
+        """Обновляет сообщение, если оно есть в буфере."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove(self, message: ChatMessage) -> None:
+        """Заменяет сообщение в буфере заглушкой, не нарушая непрерывность номеров."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def clear(self, chat_id: int) -> None:
+        raise NotImplementedError
\ No newline at end of file
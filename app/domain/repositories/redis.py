@@ -1,16 +1,65 @@
 from abc import ABC, abstractmethod
+from typing import Awaitable, Callable
+
 from pydantic import BaseModel
 
+from app.domain.dto.metrics import CacheStats
+
 
 class IRedis(ABC):
     @abstractmethod
     async def clear_cache(self, path: str) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def clear_tag(self, tag: str) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     async def get_cache(self, path: str):
         raise NotImplementedError
 
     @abstractmethod
-    async def set_cache(self, path: str, value: BaseModel) -> None:
+    async def set_cache(self,
+                        path: str,
+                        value: BaseModel,
+                        tags: list[str] | None = None,
+                        ttl: int | None = None) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_many(self, paths: list[str]) -> dict:
+        """Возвращает только найденные значения: {path: value}."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set_many(self,
+                       values: dict[str, BaseModel],
+                       tags: list[str] | None = None,
+                       ttl: int | None = None) -> None:
         raise NotImplementedError
+
+    @abstractmethod
+    async def delete_many(self, paths: list[str]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_or_set(self,
+                         path: str,
+                         loader: Callable[[], Awaitable[BaseModel]],
+                         tags: list[str] | None = None,
+                         ttl: int | None = None):
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_or_set_raw(self,
+                             path: str,
+                             loader: Callable[[], Awaitable[BaseModel]],
+                             tags: list[str] | None = None,
+                             ttl: int | None = None) -> bytes:
+        """Как get_or_set, но возвращает сериализованный JSON для отдачи клиенту без разбора."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_stats(self) -> CacheStats:
+        raise NotImplementedError
\ No newline at end of file
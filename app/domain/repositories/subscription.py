@@ -14,5 +14,13 @@ class ISubscription(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def delete(self, subscription_id: int, current_user_id: int) -> None:
+    async def get_follower_ids(self, followed_user_id: int, limit: int) -> list[int]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_followed_user_ids(self, follower_id: int, limit: int) -> list[int]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(self, subscription_id: int, current_user_id: int) -> Subscription:
         raise NotImplementedError
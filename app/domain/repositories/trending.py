@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+
+from app.domain.dto.pagination import PaginatedResponse
+
+
+class ITrending(ABC):
+    @abstractmethod
+    async def bump(self, post_id: int, weight: float) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove(self, post_id: int) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_page(self, offset: int, limit: int) -> PaginatedResponse:
+        """Страница рейтинга; results - id постов по убыванию рейтинга."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def trim(self) -> int:
+        raise NotImplementedError
\ No newline at end of file
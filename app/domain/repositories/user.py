@@ -21,3 +21,7 @@ class IUser(ABC):
     @abstractmethod
     async def get_by_id(self, user_id: int) -> User:
         raise NotImplementedError
+
+    @abstractmethod
+    async def filter_existing_ids(self, user_ids: list[int]) -> list[int]:
+        raise NotImplementedError
@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+
+
+class IVersion(ABC):
+    @abstractmethod
+    async def get(self, namespace: str) -> str | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def bump(self, *namespaces: str) -> None:
+        raise NotImplementedError
\ No newline at end of file
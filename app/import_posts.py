@@ -0,0 +1,98 @@
+"""Массовый импорт постов из NDJSON.
+
+Каждая строка - объект PostCreate: {"user_id": 1, "text_content": "..."}.
+
+    python -m app.import_posts posts.ndjson [--batch-size 5000] [--errors errors.ndjson]
+
+В файл --errors пишутся объекты {"line", "error", "row"}, где row - исходная строка для повторного импорта.
+
+Вместо файла можно передать "-" и читать строки из stdin.
+"""
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from typing import IO, Iterator
+
+from app.domain.dto.post import PostImportError
+from app.domain.exceptions.post import PostCreateError
+from app.infrastructure.database.database import AsyncSessionLocal, engine
+from app.infrastructure.database.redis import RedisClient
+from app.infrastructure.database.repositories.post_repository import PostRepository
+from app.infrastructure.database.repositories.user_repository import UserRepository
+from app.infrastructure.database.repositories.version_repository import VersionRepository
+from app.infrastructure.settings.config import POSTS_IMPORT_BATCH_SIZE
+from app.infrastructure.settings.logger import setup_logging
+from app.services.core_services.post_import_service import PostImportService
+
+
+def _read_batches(source: IO[str], batch_size: int) -> Iterator[list[tuple[int, str]]]:
+    batch = []
+    for line_number, line in enumerate(source, start=1):
+        if not line.strip():
+            continue
+        batch.append((line_number, line))
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def import_posts(source: IO[str], batch_size: int, errors_output: IO[str] | None) -> tuple[int, int]:
+    imported = failed = 0
+    started_at = time.perf_counter()
+    async with AsyncSessionLocal() as session:
+        service = PostImportService(PostRepository(session), UserRepository(session))
+        for batch in _read_batches(source, batch_size):
+            try:
+                report = await service.import_batch(batch)
+            except PostCreateError as e:
+                # пачка откатывается целиком, импорт продолжается со следующей
+                logging.error(f"Lines {batch[0][0]}-{batch[-1][0]} were not imported: {e.message}")
+                failed += len(batch)
+                if errors_output:
+                    for line_number, line in batch:
+                        error = PostImportError(line=line_number, error=e.message, row=line.rstrip('\n'))
+                        errors_output.write(error.model_dump_json() + '\n')
+                continue
+
+            imported += report.imported
+            failed += len(report.errors)
+            for error in report.errors:
+                logging.warning(f"Line {error.line} skipped: {error.error}")
+                if errors_output:
+                    errors_output.write(error.model_dump_json() + '\n')
+
+            elapsed = time.perf_counter() - started_at
+            logging.info(f"Imported {imported} posts, skipped {failed} rows ({imported / elapsed:.0f} rows/s)")
+    return imported, failed
+
+
+async def main(args: argparse.Namespace) -> int:
+    source = sys.stdin if args.path == '-' else open(args.path, encoding='utf-8')
+    errors_output = open(args.errors, 'w', encoding='utf-8') if args.errors else None
+    try:
+        imported, failed = await import_posts(source, args.batch_size, errors_output)
+        if imported:
+            await VersionRepository(RedisClient.get_redis()).bump('posts')
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if errors_output:
+            errors_output.close()
+        await engine.dispose()
+        await RedisClient.close()
+    logging.info(f"Import finished: {imported} posts imported, {failed} rows skipped")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Bulk import of posts from NDJSON')
+    parser.add_argument('path', help='NDJSON file with one PostCreate object per line, "-" for stdin')
+    parser.add_argument('--batch-size', type=int, default=POSTS_IMPORT_BATCH_SIZE, help='rows per COPY transaction')
+    parser.add_argument('--errors',
+                        help='NDJSON file for rejected rows: {"line", "error", "row"} with the original row in "row"')
+    setup_logging()
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,52 @@
+"""posts keyset index
+
+Revision ID: 7c1e4a9b2d35
+Revises: 546fbcf767b0
+Create Date: 2026-10-18 09:10:12.402118
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7c1e4a9b2d35"
+down_revision: Union[str, None] = "546fbcf767b0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # the composite index covers every lookup of ix_posts_created_at
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_posts_created_at_id",
+            "posts",
+            ["created_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            op.f("ix_posts_created_at"),
+            table_name="posts",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_posts_created_at"),
+            "posts",
+            ["created_at"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_posts_created_at_id",
+            table_name="posts",
+            postgresql_concurrently=True,
+        )
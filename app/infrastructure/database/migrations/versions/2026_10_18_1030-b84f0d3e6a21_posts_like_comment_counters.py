@@ -0,0 +1,60 @@
+"""posts like and comment counters
+
+Revision ID: b84f0d3e6a21
+Revises: 7c1e4a9b2d35
+Create Date: 2026-10-18 10:30:44.918204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b84f0d3e6a21"
+down_revision: Union[str, None] = "7c1e4a9b2d35"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "posts",
+        sa.Column(
+            "likes_count", sa.Integer(), server_default="0", nullable=False
+        ),
+    )
+    op.add_column(
+        "posts",
+        sa.Column(
+            "comments_count",
+            sa.Integer(),
+            server_default="0",
+            nullable=False,
+        ),
+    )
+    op.execute(
+        """
+        UPDATE posts SET likes_count = counts.value
+        FROM (
+            SELECT post_id, count(*) AS value FROM likes GROUP BY post_id
+        ) AS counts
+        WHERE posts.id = counts.post_id
+        """
+    )
+    op.execute(
+        """
+        UPDATE posts SET comments_count = counts.value
+        FROM (
+            SELECT post_id, count(*) AS value FROM comments GROUP BY post_id
+        ) AS counts
+        WHERE posts.id = counts.post_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("posts", "comments_count")
+    op.drop_column("posts", "likes_count")
@@ -0,0 +1,55 @@
+"""posts search vector
+
+Revision ID: e3a9c57f1d08
+Revises: b84f0d3e6a21
+Create Date: 2026-10-18 12:15:41.873205
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e3a9c57f1d08"
+down_revision: Union[str, None] = "b84f0d3e6a21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "posts",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "to_tsvector('simple', coalesce(text_content, ''))",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_posts_search_vector",
+            "posts",
+            ["search_vector"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_posts_search_vector",
+            table_name="posts",
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+    op.drop_column("posts", "search_vector")
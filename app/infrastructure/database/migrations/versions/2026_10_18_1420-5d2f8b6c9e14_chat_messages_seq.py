@@ -0,0 +1,64 @@
+"""chat messages seq
+
+Revision ID: 5d2f8b6c9e14
+Revises: e3a9c57f1d08
+Create Date: 2026-10-18 14:20:07.512384
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5d2f8b6c9e14"
+down_revision: Union[str, None] = "e3a9c57f1d08"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "chat",
+        sa.Column("last_seq", sa.BIGINT(), server_default="0", nullable=False),
+    )
+    op.add_column("chat_messages", sa.Column("seq", sa.BIGINT(), nullable=True))
+    # существующие сообщения нумеруются в порядке создания
+    op.execute(
+        """
+        UPDATE chat_messages
+        SET seq = numbered.seq
+        FROM (
+            SELECT id, row_number() OVER (PARTITION BY chat_id ORDER BY id) AS seq
+            FROM chat_messages
+        ) AS numbered
+        WHERE chat_messages.id = numbered.id
+        """
+    )
+    op.execute(
+        """
+        UPDATE chat
+        SET last_seq = counts.last_seq
+        FROM (
+            SELECT chat_id, max(seq) AS last_seq
+            FROM chat_messages
+            GROUP BY chat_id
+        ) AS counts
+        WHERE chat.id = counts.chat_id
+        """
+    )
+    op.alter_column("chat_messages", "seq", nullable=False)
+    op.create_index(
+        "ix_chat_messages_chat_id_seq",
+        "chat_messages",
+        ["chat_id", "seq"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_chat_messages_chat_id_seq", table_name="chat_messages")
+    op.drop_column("chat_messages", "seq")
+    op.drop_column("chat", "last_seq")
\ No newline at end of file
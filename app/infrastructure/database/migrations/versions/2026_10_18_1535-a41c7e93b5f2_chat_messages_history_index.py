@@ -0,0 +1,50 @@
+"""chat messages history index
+
+Revision ID: a41c7e93b5f2
+Revises: 5d2f8b6c9e14
+Create Date: 2026-10-18 15:35:52.104918
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a41c7e93b5f2"
+down_revision: Union[str, None] = "5d2f8b6c9e14"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_chat_messages_chat_id_id",
+            "chat_messages",
+            ["chat_id", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_chat_messages_chat_id",
+            table_name="chat_messages",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_chat_messages_chat_id",
+            "chat_messages",
+            ["chat_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_chat_messages_chat_id_id",
+            table_name="chat_messages",
+            postgresql_concurrently=True,
+        )
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import BIGINT, ForeignKey, String, TIMESTAMP, func, UniqueConstraint
+from sqlalchemy import BIGINT, ForeignKey, Index, String, TIMESTAMP, func, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
 
@@ -12,6 +12,8 @@ class Chat(Base):
     id: Mapped[int] = mapped_column(BIGINT, primary_key=True)
     first_user_id: Mapped[int] = mapped_column(BIGINT, ForeignKey('users.id', ondelete="CASCADE"), index=True)
     second_user_id: Mapped[int] = mapped_column(BIGINT, ForeignKey('users.id', ondelete="CASCADE"), index=True)
+    # последний выданный номер сообщения в чате
+    last_seq: Mapped[int] = mapped_column(BIGINT, server_default='0')
 
     # Указываем foreign_keys и устанавливаем связи
     first_user: Mapped["User"] = relationship("User", foreign_keys=[first_user_id],
@@ -30,10 +32,18 @@ class ChatMessage(Base):
     __tablename__ = 'chat_messages'
 
     id: Mapped[int] = mapped_column(BIGINT, primary_key=True)
-    chat_id: Mapped[int] = mapped_column(BIGINT, ForeignKey('chat.id', ondelete="CASCADE"), index=True)
+    chat_id: Mapped[int] = mapped_column(BIGINT, ForeignKey('chat.id', ondelete="CASCADE"))
     sender_id: Mapped[int] = mapped_column(BIGINT, ForeignKey('users.id', ondelete="CASCADE"), index=True)
+    # номер сообщения внутри чата, монотонно растет без повторов
+    seq: Mapped[int] = mapped_column(BIGINT)
     text: Mapped[str] = mapped_column(String(2048))
     created_at: Mapped[datetime] = mapped_column(TIMESTAMP, server_default=func.now(), index=True)
     updated_at: Mapped[datetime] = mapped_column(TIMESTAMP, server_default=func.now(), onupdate=func.now(), index=True)
 
     chat = relationship("Chat", back_populates="messages")
+
+    __table_args__ = (
+        Index('ix_chat_messages_chat_id_seq', 'chat_id', 'seq', unique=True),
+        # история чата листается по id, индекс заменяет одиночный по chat_id
+        Index('ix_chat_messages_chat_id_id', 'chat_id', 'id'),
+    )
@@ -1,8 +1,10 @@
-from sqlalchemy import ForeignKey, BIGINT, TIMESTAMP, func, String, Boolean
+from sqlalchemy import ForeignKey, BIGINT, TIMESTAMP, func, String, Boolean, Index, Integer, Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from datetime import datetime
 
 from .base import Base
+from app.infrastructure.settings.config import POSTS_SEARCH_CONFIG
 
 
 class Post(Base):
@@ -10,14 +12,26 @@ class Post(Base):
 
     id: Mapped[int] = mapped_column(BIGINT, primary_key=True)
     user_id: Mapped[int] = mapped_column(BIGINT, ForeignKey('users.id'), nullable=False, index=True)
-    created_at: Mapped[datetime] = mapped_column(TIMESTAMP, server_default=func.now(), nullable=False, index=True)
+    created_at: Mapped[datetime] = mapped_column(TIMESTAMP, server_default=func.now(), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(TIMESTAMP, server_default=func.now(), onupdate=func.now(), nullable=True)
     text_content: Mapped[str] = mapped_column(String, nullable=True)
     is_repost: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    likes_count: Mapped[int] = mapped_column(Integer, server_default='0', nullable=False)
+    comments_count: Mapped[int] = mapped_column(Integer, server_default='0', nullable=False)
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(f"to_tsvector('{POSTS_SEARCH_CONFIG}', coalesce(text_content, ''))", persisted=True),
+        nullable=True
+    )
 
     user = relationship('User', back_populates='posts')
     likes = relationship('Like', back_populates='post', cascade='all, delete')
     comments = relationship("Comment", back_populates="post", cascade='all, delete')
     images = relationship('Image', back_populates='post', cascade='all, delete')
 
+    __table_args__ = (
+        Index('ix_posts_created_at_id', 'created_at', 'id'),
+        Index('ix_posts_search_vector', 'search_vector', postgresql_using='gin'),
+    )
+
 
@@ -5,6 +5,7 @@ from app.infrastructure.settings.config import REDIS_URL
 
 class RedisClient:
     _redis: Redis | None = None
+    _binary_redis: Redis | None = None
 
     @classmethod
     def get_redis(cls) -> Redis:
@@ -12,8 +13,18 @@ class RedisClient:
             cls._redis = Redis.from_url(REDIS_URL, decode_responses=True)
         return cls._redis
 
+    @classmethod
+    def get_binary_redis(cls) -> Redis:
+        """Клиент без декодирования ответов для бинарных значений кеша."""
+        if cls._binary_redis is None:
+            cls._binary_redis = Redis.from_url(REDIS_URL)
+        return cls._binary_redis
+
     @classmethod
     async def close(cls) -> None:
         if cls._redis:
             await cls._redis.close()
-            cls._redis = None
\ No newline at end of file
+            cls._redis = None
+        if cls._binary_redis:
+            await cls._binary_redis.close()
+            cls._binary_redis = None
\ No newline at end of file
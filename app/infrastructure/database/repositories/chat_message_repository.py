@@ -1,13 +1,15 @@
 import logging
 
-from sqlalchemy import func
+from collections import Counter
+
+from sqlalchemy import case, insert, update
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.future import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.entities.chat import ChatMessage as ChatMessageEntity
 from app.domain.dto.chat import ChatMessageCreate, ChatMessageUpdate
-from app.domain.dto.pagination import PaginatedResponse
+from app.domain.dto.pagination import ChatHistoryResponse
 from app.domain.repositories.chat_message import IChatMessage
 from app.domain.exceptions.chat import (
     ChatDoesNotExist,
@@ -17,7 +19,7 @@ from app.domain.exceptions.chat import (
     MessageDeleteError
 )
 
-from app.infrastructure.database.repositories.utils.pages import get_prev_next_pages
+from app.infrastructure.database.repositories.utils.pages import get_message_history_pages
 from app.infrastructure.database.models import ChatMessage as ChatMessageModel, Chat as ChatModel
 
 
@@ -25,13 +27,45 @@ class ChatMessageRepository(IChatMessage):
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    async def _reserve_seqs(self, counts: Counter) -> dict[int, int]:
+        """Увеличивает chat.last_seq на количество новых сообщений; возвращает новые last_seq.
+
+        Строки чатов блокируются до конца транзакции в порядке id, чтобы параллельные
+        пачки с общими чатами не взаимоблокировались.
+        """
+        locked = (
+            select(ChatModel.id)
+            .where(ChatModel.id.in_(counts))
+            .order_by(ChatModel.id)
+            .with_for_update()
+            .cte('locked')
+        )
+        result = await self.db.execute(
+            update(ChatModel)
+            .where(ChatModel.id == locked.c.id)
+            .values(last_seq=ChatModel.last_seq + case(dict(counts), value=ChatModel.id))
+            .returning(ChatModel.id, ChatModel.last_seq)
+            .execution_options(synchronize_session=False)
+        )
+        return {chat_id: last_seq for chat_id, last_seq in result.all()}
+
+    def _with_seqs(self, messages: list[ChatMessageCreate], last_seqs: dict[int, int]) -> list[dict]:
+        counts = Counter(message.chat_id for message in messages)
+        next_seqs = {chat_id: last_seqs[chat_id] - count + 1 for chat_id, count in counts.items()}
+        rows = []
+        for message in messages:
+            rows.append({**message.model_dump(), 'seq': next_seqs[message.chat_id]})
+            next_seqs[message.chat_id] += 1
+        return rows
+
     async def save(self, message: ChatMessageCreate) -> ChatMessageEntity:
-        chat = await self.db.get(ChatModel, message.chat_id)
-        if not chat:
+        last_seqs = await self._reserve_seqs(Counter([message.chat_id]))
+        if not last_seqs:
+            await self.db.rollback()
             logging.warning(f"Чат с id={message.chat_id} не существует")
             raise ChatDoesNotExist("Чат не существует")
 
-        new_message = ChatMessageModel(**message.model_dump())
+        new_message = ChatMessageModel(**self._with_seqs([message], last_seqs)[0])
         self.db.add(new_message)
 
         try:
@@ -40,32 +74,71 @@ class ChatMessageRepository(IChatMessage):
             logging.info(f"Сообщение с id={new_message.id} успешно создано")
             return ChatMessageEntity.model_validate(new_message)
         except IntegrityError as e:
+            await self.db.rollback()
             logging.error(f"Ошибка целостности при создании сообщения: {str(e)}")
             raise MessageCreateError("Ошибка при создании сообщения")
 
-    async def get_by_chat_id(self, chat_id: int, offset: int, limit: int) -> PaginatedResponse:
-        count_result = await self.db.execute(select(func.count()).where(ChatMessageModel.chat_id == chat_id))
-        count = count_result.scalar()
-        if count == 0:
-            logging.warning(f"Сообщения с chat_id={chat_id} не найдены")
-            return PaginatedResponse(count=count)
+    async def save_many(self, messages: list[ChatMessageCreate]) -> list[ChatMessageEntity]:
+        counts = Counter(message.chat_id for message in messages)
+        last_seqs = await self._reserve_seqs(counts)
+        if len(last_seqs) != len(counts):
+            await self.db.rollback()
+            logging.warning(f"Чаты с id={set(counts) - set(last_seqs)} не существуют")
+            raise MessageCreateError("Ошибка при создании сообщений")
 
-        messages_result = await self.db.execute(
+        stmt = insert(ChatMessageModel).returning(ChatMessageModel, sort_by_parameter_order=True)
+        try:
+            result = await self.db.execute(stmt, self._with_seqs(messages, last_seqs))
+            new_messages = result.scalars().all()
+            await self.db.commit()
+        except IntegrityError as e:
+            await self.db.rollback()
+            logging.error(f"Ошибка целостности при создании {len(messages)} сообщений: {str(e)}")
+            raise MessageCreateError("Ошибка при создании сообщений")
+
+        logging.info(f"{len(new_messages)} сообщений успешно создано")
+        return [ChatMessageEntity.model_validate(message) for message in new_messages]
+
+    async def get_history(self,
+                          chat_id: int,
+                          before_id: int | None,
+                          after_id: int | None,
+                          limit: int) -> ChatHistoryResponse:
+        query = select(ChatMessageModel).where(ChatMessageModel.chat_id == chat_id)
+        if after_id is not None:
+            query = query.where(ChatMessageModel.id > after_id).order_by(ChatMessageModel.id)
+        else:
+            if before_id is not None:
+                query = query.where(ChatMessageModel.id < before_id)
+            query = query.order_by(ChatMessageModel.id.desc())
+
+        # лишняя строка показывает, есть ли следующая страница, без count(*)
+        result = await self.db.execute(query.limit(limit + 1))
+        messages = [ChatMessageEntity.model_validate(message) for message in result.scalars().all()]
+        has_more = len(messages) > limit
+        messages = messages[:limit]
+        if after_id is None:
+            messages.reverse()
+            has_older, has_newer = has_more, before_id is not None
+        else:
+            has_older, has_newer = after_id > 0, has_more
+
+        first_id = messages[0].id if messages else None
+        last_id = messages[-1].id if messages else None
+        prev_page, next_page = get_message_history_pages(chat_id, first_id, last_id, limit, has_older, has_newer)
+        logging.info(f"{len(messages)} сообщений чата id={chat_id} найдено")
+        return ChatHistoryResponse(prev=prev_page, next=next_page, results=messages)
+
+    async def get_after_seq(self, chat_id: int, seq: int, limit: int) -> list[ChatMessageEntity]:
+        result = await self.db.execute(
             select(ChatMessageModel)
-            .where(ChatMessageModel.chat_id == chat_id)
-            .offset(offset)
+            .where(ChatMessageModel.chat_id == chat_id, ChatMessageModel.seq > seq)
+            .order_by(ChatMessageModel.seq)
             .limit(limit)
         )
-        messages = messages_result.scalars().all()
-
-        prev_page, next_page = get_prev_next_pages(offset, limit, count, 'messages')
-        logging.info(f"Сообщения с chat_id={chat_id} найдены")
-        return PaginatedResponse(
-            count=count,
-            prev=prev_page,
-            next=next_page,
-            results=[ChatMessageEntity.model_validate(message) for message in messages]
-        )
+        messages = result.scalars().all()
+        logging.info(f"{len(messages)} сообщений чата id={chat_id} после seq={seq} найдено")
+        return [ChatMessageEntity.model_validate(message) for message in messages]
 
     async def get_message_by_id(self, message_id: int) -> ChatMessageEntity:
         message = await self.db.get(ChatMessageModel, message_id)
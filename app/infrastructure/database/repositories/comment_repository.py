@@ -1,6 +1,5 @@
 import logging
 
-from sqlalchemy import func
 from sqlalchemy.future import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -17,6 +16,7 @@ from app.domain.exceptions.comment import (
 )
 from app.infrastructure.database.repositories.utils.pages import get_prev_next_pages
 from app.infrastructure.database.models.comment import Comment as CommentModel
+from app.infrastructure.database.models.post import Post as PostModel
 
 
 class CommentRepository:
@@ -41,8 +41,8 @@ class CommentRepository:
             raise CommentCreateError("Error creating comment")
 
     async def get_all_by_post_id(self, post_id: int, offset: int, limit: int) -> PaginatedResponse:
-        count_result = await self.db.execute(select(func.count()).filter(CommentModel.post_id == post_id))
-        count = count_result.scalar()
+        count_result = await self.db.execute(select(PostModel.comments_count).filter(PostModel.id == post_id))
+        count = count_result.scalar() or 0
 
         result = await self.db.execute(
             select(CommentModel).filter(CommentModel.post_id == post_id).offset(offset).limit(limit))
@@ -79,7 +79,7 @@ class CommentRepository:
             logging.error(f"Integrity error: {str(e)}")
             raise CommentUpdateError("Error updating comment")
 
-    async def delete(self, comment_id: int, current_user_id: int) -> None:
+    async def delete(self, comment_id: int, current_user_id: int) -> CommentEntity:
         result = await self.db.execute(select(CommentModel).filter(CommentModel.id == comment_id))
         db_comment = result.scalars().first()
 
@@ -94,6 +94,7 @@ class CommentRepository:
             await self.db.delete(db_comment)
             await self.db.commit()
             logging.info("Comment deleted successfully")
+            return CommentEntity.model_validate(db_comment)
         except IntegrityError as e:
             await self.db.rollback()
             logging.error(f"Integrity error: {str(e)}")
@@ -0,0 +1,66 @@
+import logging
+from collections import defaultdict
+from uuid import uuid4
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.domain.repositories.counter import ICounter
+from app.infrastructure.database.repositories.utils.locks import RELEASE_LOCK_SCRIPT
+from app.infrastructure.settings.config import POST_COUNTERS_FLUSH_LOCK_TTL
+
+# Атомарно забирает накопленные приращения: незавершенный сброс (flushing) имеет приоритет
+_TAKE_PENDING_SCRIPT = """
+if redis.call('EXISTS', KEYS[2]) == 0 then
+    if redis.call('EXISTS', KEYS[1]) == 0 then
+        return {}
+    end
+    redis.call('RENAME', KEYS[1], KEYS[2])
+end
+return redis.call('HGETALL', KEYS[2])
+"""
+
+
+class CounterRepository(ICounter):
+    """Приращения счетчиков постов в hash вида {post_id}:{likes|comments} -> delta."""
+
+    def __init__(self, redis: Redis):
+        self.redis = redis
+        self.pending_key = "counters.posts:pending"
+        self.flushing_key = "counters.posts:flushing"
+        self.lock_key = "counters.posts:lock"
+
+    async def incr(self, post_id: int, likes: int = 0, comments: int = 0) -> None:
+        pipe = self.redis.pipeline(transaction=False)
+        if likes:
+            pipe.hincrby(self.pending_key, f'{post_id}:likes', likes)
+        if comments:
+            pipe.hincrby(self.pending_key, f'{post_id}:comments', comments)
+        try:
+            await pipe.execute()
+        except RedisError as e:
+            # лайк или комментарий уже сохранен: теряется только приращение, его фиксируем в логе
+            logging.error(f"Error incrementing counters of post id={post_id} (likes={likes}, comments={comments}): {e}")
+
+    async def acquire_flush_lock(self) -> str | None:
+        token = uuid4().hex
+        if await self.redis.set(self.lock_key, token, nx=True, ex=POST_COUNTERS_FLUSH_LOCK_TTL):
+            return token
+        return None
+
+    async def release_flush_lock(self, token: str) -> None:
+        # блокировку, истекшую во время долгого сброса и взятую другим воркером, не трогаем
+        await self.redis.eval(RELEASE_LOCK_SCRIPT, 1, self.lock_key, token)
+
+    async def take_pending(self) -> dict[int, dict[str, int]]:
+        values = await self.redis.eval(_TAKE_PENDING_SCRIPT, 2, self.pending_key, self.flushing_key)
+        deltas = defaultdict(dict)
+        for field, delta in zip(values[::2], values[1::2]):
+            post_id, counter = field.split(':')
+            if int(delta):
+                deltas[int(post_id)][counter] = int(delta)
+        logging.info(f"Counter deltas taken for {len(deltas)} posts")
+        return dict(deltas)
+
+    async def ack_pending(self) -> None:
+        await self.redis.delete(self.flushing_key)
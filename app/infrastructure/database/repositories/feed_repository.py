@@ -0,0 +1,98 @@
+import logging
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.domain.dto.pagination import CursorPaginatedResponse
+from app.domain.repositories.feed import IFeed
+from app.infrastructure.database.repositories.utils.cursors import encode_cursor, decode_id_cursor
+from app.infrastructure.database.repositories.utils.pages import get_next_cursor_page
+from app.infrastructure.settings.config import (
+    FEED_TIMELINE_MAX_LENGTH,
+    FEED_FANOUT_BATCH_SIZE,
+    FEED_CELEBRITY_POSTS_MAX_LENGTH
+)
+
+
+class FeedRepository(IFeed):
+    """Ленты подписчиков в sorted set: member и score - id поста, он монотонно растет вместе с created_at."""
+
+    def __init__(self, redis: Redis):
+        self.redis = redis
+        self.timeline_path = "feed.timeline"
+        self.celebrity_posts_path = "feed.celebrity_posts"
+        self.celebrities_key = "feed.celebrities"
+
+    def _timeline_key(self, user_id: int) -> str:
+        return f'{self.timeline_path}:{user_id}'
+
+    def _celebrity_posts_key(self, user_id: int) -> str:
+        return f'{self.celebrity_posts_path}:{user_id}'
+
+    @staticmethod
+    def _max_score(cursor: str | None) -> str:
+        return f'({decode_id_cursor(cursor)}' if cursor else '+inf'
+
+    async def push(self, post_id: int, user_ids: list[int]) -> None:
+        try:
+            for start in range(0, len(user_ids), FEED_FANOUT_BATCH_SIZE):
+                pipe = self.redis.pipeline(transaction=False)
+                for user_id in user_ids[start:start + FEED_FANOUT_BATCH_SIZE]:
+                    key = self._timeline_key(user_id)
+                    pipe.zadd(key, {post_id: post_id})
+                    pipe.zremrangebyrank(key, 0, -FEED_TIMELINE_MAX_LENGTH - 1)
+                await pipe.execute()
+            logging.info(f"Post id={post_id} pushed to {len(user_ids)} timelines")
+        except RedisError as e:
+            logging.error(f"Error pushing post id={post_id} to timelines: {e}")
+
+    async def get_post_ids(self, user_id: int, cursor: str | None, limit: int) -> list[int]:
+        post_ids = await self.redis.zrevrangebyscore(
+            self._timeline_key(user_id), self._max_score(cursor), '-inf', start=0, num=limit
+        )
+        return [int(post_id) for post_id in post_ids]
+
+    async def push_celebrity(self, post_id: int, user_id: int) -> None:
+        key = self._celebrity_posts_key(user_id)
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.sadd(self.celebrities_key, user_id)
+        pipe.zadd(key, {post_id: post_id})
+        pipe.zremrangebyrank(key, 0, -FEED_CELEBRITY_POSTS_MAX_LENGTH - 1)
+        try:
+            await pipe.execute()
+            logging.info(f"Post id={post_id} added to recent posts of celebrity user_id={user_id}")
+        except RedisError as e:
+            logging.error(f"Error adding post id={post_id} to celebrity recent posts: {e}")
+
+    async def filter_celebrity_ids(self, user_ids: list[int]) -> list[int]:
+        if not user_ids:
+            return []
+        try:
+            flags = await self.redis.smismember(self.celebrities_key, user_ids)
+        except RedisError as e:
+            logging.error(f"Error checking celebrity users: {e}")
+            return []
+        return [user_id for user_id, flag in zip(user_ids, flags) if flag]
+
+    async def get_celebrity_post_ids(self, user_ids: list[int], cursor: str | None, limit: int) -> list[list[int]]:
+        if not user_ids:
+            return []
+        max_score = self._max_score(cursor)
+        pipe = self.redis.pipeline(transaction=False)
+        for user_id in user_ids:
+            pipe.zrevrangebyscore(self._celebrity_posts_key(user_id), max_score, '-inf', start=0, num=limit)
+        try:
+            results = await pipe.execute()
+        except RedisError as e:
+            # лента остается работоспособной без постов популярных авторов
+            logging.error(f"Error reading celebrity posts: {e}")
+            return []
+        return [[int(post_id) for post_id in post_ids] for post_ids in results]
+
+    def get_page(self, post_ids: list[int], limit: int) -> CursorPaginatedResponse:
+        next_cursor = encode_cursor(post_ids[-1]) if len(post_ids) == limit else None
+        return CursorPaginatedResponse(
+            next_cursor=next_cursor,
+            next=get_next_cursor_page(next_cursor, limit, 'feed'),
+            results=post_ids
+        )
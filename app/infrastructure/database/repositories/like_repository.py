@@ -1,6 +1,7 @@
 import logging
 
-from sqlalchemy import func
+from sqlalchemy import BIGINT, any_, bindparam, delete
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
@@ -8,40 +9,80 @@ from sqlalchemy.future import select
 from app.domain.dto.pagination import PaginatedResponse
 from app.domain.repositories.like import ILike
 from app.domain.entities.like import Like as LikeEntity
-from app.domain.exceptions.base import AccessError
+from app.domain.exceptions.post import PostDoesNotExist
 from app.domain.exceptions.like import (
     AlreadyLikedPost,
-    LikeDoesNotExist,
     LikeDeleteError,
 )
 
 from app.infrastructure.database.repositories.utils.pages import get_prev_next_pages
 from app.infrastructure.database.models.like import Like as LikeModel
+from app.infrastructure.database.models.post import Post as PostModel
 
 
 class LikeRepository(ILike):
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def save(self, post_id: int, current_user_id: int) -> LikeEntity:
-        like = LikeModel(
-            user_id=current_user_id,
-            post_id=post_id
+    @staticmethod
+    def _insert_like(post_id: int, current_user_id: int):
+        return (
+            insert(LikeModel)
+            .values(user_id=current_user_id, post_id=post_id)
+            .on_conflict_do_nothing(constraint='unique_like')
         )
-        self.db.add(like)
+
+    async def save(self, post_id: int, current_user_id: int) -> LikeEntity:
         try:
+            result = await self.db.execute(self._insert_like(post_id, current_user_id).returning(LikeModel))
+            like = result.scalar()
             await self.db.commit()
-            await self.db.refresh(like)
-            logging.info(f'Like with id={like.id} created by user {like.user_id} for post {post_id}')
-            return LikeEntity.model_validate(like)
         except IntegrityError:
             await self.db.rollback()
+            logging.error(f'Post {post_id} liked by user {current_user_id} does not exist')
+            raise PostDoesNotExist("Post does not exist")
+
+        if like is None:
             logging.error(f'Like by user {current_user_id} for post {post_id} already exists')
             raise AlreadyLikedPost("You have already liked this post")
 
+        logging.info(f'Like with id={like.id} created by user {like.user_id} for post {post_id}')
+        return LikeEntity.model_validate(like)
+
+    async def like(self, post_id: int, current_user_id: int) -> bool:
+        # INSERT ... ON CONFLICT DO NOTHING RETURNING: один запрос, повтор безопасен
+        try:
+            result = await self.db.execute(self._insert_like(post_id, current_user_id).returning(LikeModel.id))
+            like_id = result.scalar()
+            await self.db.commit()
+        except IntegrityError:
+            await self.db.rollback()
+            logging.error(f'Post {post_id} liked by user {current_user_id} does not exist')
+            raise PostDoesNotExist("Post does not exist")
+
+        logging.info(f'Post {post_id} liked by user {current_user_id}, created={like_id is not None}')
+        return like_id is not None
+
+    async def unlike(self, post_id: int, current_user_id: int) -> bool:
+        try:
+            result = await self.db.execute(
+                delete(LikeModel)
+                .where(LikeModel.post_id == post_id, LikeModel.user_id == current_user_id)
+                .returning(LikeModel.id)
+            )
+            like_id = result.scalar()
+            await self.db.commit()
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            logging.error(f"error deleting like: {e}")
+            raise LikeDeleteError("error deleting like")
+
+        logging.info(f'Post {post_id} unliked by user {current_user_id}, deleted={like_id is not None}')
+        return like_id is not None
+
     async def get_all_by_post_id(self, post_id: int, offset: int, limit: int) -> PaginatedResponse:
-        count_result = await self.db.execute(select(func.count()).where(LikeModel.post_id == post_id))
-        count = count_result.scalar()
+        count_result = await self.db.execute(select(PostModel.likes_count).where(PostModel.id == post_id))
+        count = count_result.scalar() or 0
 
         result = await self.db.execute(
             select(LikeModel).where(LikeModel.post_id == post_id).offset(offset).limit(limit)
@@ -63,22 +104,11 @@ class LikeRepository(ILike):
             results=likes_entities
         )
 
-    async def delete(self, like_id: int, current_user_id: int) -> None:
-        result = await self.db.execute(select(LikeModel).where(LikeModel.id == like_id))
-        like = result.scalars().first()
-
-        if not like:
-            logging.warning(f'User {current_user_id} tried to delete non-existing like {like_id}')
-            raise LikeDoesNotExist(f"Like with id={like_id} does not exist")
-
-        if like.user_id != current_user_id:
-            logging.warning(f'User {current_user_id} tried to delete like {like_id} without permission')
-            raise AccessError("You do not have access rights")
-
-        try:
-            await self.db.delete(like)
-            await self.db.commit()
-            logging.info(f'Like {like_id} deleted by user {current_user_id}')
-        except SQLAlchemyError as e:
-            logging.error(f"error deleting like: {e}")
-            raise LikeDeleteError("error deleting like")
+    async def get_liked_post_ids(self, user_id: int, post_ids: list[int]) -> list[int]:
+        # Один параметр-массив вместо IN (...): запрос идет по индексу unique_like (user_id, post_id)
+        result = await self.db.execute(
+            select(LikeModel.post_id)
+            .where(LikeModel.user_id == user_id)
+            .where(LikeModel.post_id == any_(bindparam('post_ids', post_ids, type_=ARRAY(BIGINT))))
+        )
+        return list(result.scalars().all())
@@ -0,0 +1,58 @@
+import logging
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.domain.repositories.like_status import ILikeStatus
+from app.infrastructure.settings.config import LIKE_STATUS_CACHE_TTL
+
+
+class LikeStatusRepository(ILikeStatus):
+    """Кэш "лайкнул ли пользователь пост": hash на пользователя, поле - id поста, значение 1 или 0."""
+
+    def __init__(self, redis: Redis):
+        self.redis = redis
+        self.cache_path = "likes.status"
+
+    def _key(self, user_id: int) -> str:
+        return f'{self.cache_path}:{user_id}'
+
+    async def get(self, user_id: int, post_ids: list[int]) -> dict[int, bool]:
+        try:
+            values = await self.redis.hmget(self._key(user_id), post_ids)
+        except RedisError as e:
+            logging.error(f"Error getting like statuses for user_id={user_id}: {e}")
+            return {}
+        return {post_id: value == '1' for post_id, value in zip(post_ids, values) if value is not None}
+
+    async def set(self, user_id: int, statuses: dict[int, bool]) -> None:
+        if not statuses:
+            return
+        key = self._key(user_id)
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hset(key, mapping={post_id: int(liked) for post_id, liked in statuses.items()})
+        pipe.expire(key, LIKE_STATUS_CACHE_TTL)
+        try:
+            await pipe.execute()
+        except RedisError as e:
+            logging.error(f"Error caching like statuses for user_id={user_id}: {e}")
+
+    async def fill(self, user_id: int, statuses: dict[int, bool]) -> None:
+        if not statuses:
+            return
+        key = self._key(user_id)
+        pipe = self.redis.pipeline(transaction=False)
+        # HSETNX: лайк, сохраненный между чтением БД и этой записью, уже выставил поле и важнее
+        for post_id, liked in statuses.items():
+            pipe.hsetnx(key, post_id, int(liked))
+        pipe.expire(key, LIKE_STATUS_CACHE_TTL)
+        try:
+            await pipe.execute()
+        except RedisError as e:
+            logging.error(f"Error caching like statuses for user_id={user_id}: {e}")
+
+    async def clear(self, user_id: int) -> None:
+        try:
+            await self.redis.delete(self._key(user_id))
+        except RedisError as e:
+            logging.error(f"Error clearing like statuses of user_id={user_id}: {e}")
\ No newline at end of file
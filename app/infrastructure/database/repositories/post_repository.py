@@ -1,15 +1,18 @@
 import logging
+from urllib.parse import quote
 
-from sqlalchemy import func
+from asyncpg import PostgresError
+from sqlalchemy import func, tuple_, exists, false, String, update, bindparam, any_, BIGINT
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.future import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 
-from app.domain.dto.post import PostCreate, PostUpdate
-from app.domain.dto.pagination import PaginatedResponse
+from app.domain.dto.post import PostCreate, PostUpdate, PostPublic
+from app.domain.dto.pagination import PaginatedResponse, CursorPaginatedResponse
 from app.domain.entities.post import Post as PostEntity
 from app.domain.repositories.post import IPost
-from app.domain.exceptions.base import AccessError
+from app.domain.exceptions.base import AccessError, InvalidCursorError
 from app.domain.exceptions.post import (
     PostCreateError,
     PostDoesNotExist,
@@ -17,8 +20,62 @@ from app.domain.exceptions.post import (
     PostUpdateError
 )
 
-from app.infrastructure.database.models.post import Post as PostModel
-from app.infrastructure.database.repositories.utils.pages import get_prev_next_pages
+from app.infrastructure.database.models import Post as PostModel, User as UserModel, Like as LikeModel, \
+    Image as ImageModel, Comment as CommentModel
+from app.infrastructure.database.repositories.utils.pages import get_prev_next_pages, get_next_cursor_page
+from app.infrastructure.database.repositories.utils.cursors import encode_cursor, decode_cursor, decode_time_id_cursor
+from app.infrastructure.settings.config import POSTS_SEARCH_CONFIG
+
+
+def _post_public_query(current_user_id: int | None):
+    images = func.array(
+        select(ImageModel.src)
+        .where(ImageModel.post_id == PostModel.id)
+        .order_by(ImageModel.id)
+        .scalar_subquery(),
+        type_=ARRAY(String)
+    )
+    liked_by_me = (
+        exists().where(LikeModel.post_id == PostModel.id, LikeModel.user_id == current_user_id)
+        if current_user_id is not None else false()
+    )
+    return (
+        select(
+            PostModel.id,
+            PostModel.user_id,
+            PostModel.text_content,
+            PostModel.is_repost,
+            PostModel.created_at,
+            PostModel.updated_at,
+            UserModel.username.label("author_username"),
+            PostModel.likes_count,
+            PostModel.comments_count,
+            images.label("images"),
+            liked_by_me.label("liked_by_me"),
+        )
+        .join(UserModel, UserModel.id == PostModel.user_id)
+    )
+
+
+def post_search_condition(query: str):
+    """Условие полнотекстового поиска по GIN-индексу ix_posts_search_vector."""
+    return PostModel.search_vector.op('@@')(func.websearch_to_tsquery(POSTS_SEARCH_CONFIG, query))
+
+
+def _decode_rank_id_cursor(cursor: str) -> tuple[float, int]:
+    rank, post_id = decode_cursor(cursor, 2)
+    if not isinstance(rank, (int, float)) or not isinstance(post_id, int):
+        raise InvalidCursorError("Invalid cursor")
+    return float(rank), post_id
+
+
+def _apply_cursor(query, cursor: str | None):
+    # Keyset-пагинация по индексу (created_at, id): стоимость страницы не зависит от глубины
+    query = query.order_by(PostModel.created_at.desc(), PostModel.id.desc())
+    if cursor:
+        created_at, post_id = decode_time_id_cursor(cursor)
+        query = query.where(tuple_(PostModel.created_at, PostModel.id) < tuple_(created_at, post_id))
+    return query
 
 
 class PostRepository(IPost):
@@ -42,6 +99,24 @@ class PostRepository(IPost):
             logging.error(f"Error creating post: {str(e)}")
             raise PostCreateError("Error creating post")
 
+    async def bulk_save(self, posts: list[PostCreate]) -> int:
+        connection = await self.db.connection()
+        raw_connection = await connection.get_raw_connection()
+        try:
+            # COPY вместо INSERT на каждую строку; id, created_at и счетчики заполняются значениями по умолчанию
+            await raw_connection.driver_connection.copy_records_to_table(
+                PostModel.__tablename__,
+                records=[(post.user_id, post.text_content, False) for post in posts],
+                columns=['user_id', 'text_content', 'is_repost']
+            )
+            await self.db.commit()
+            logging.info(f"{len(posts)} posts copied")
+            return len(posts)
+        except (SQLAlchemyError, PostgresError) as e:
+            await self.db.rollback()
+            logging.error(f"Error copying posts: {str(e)}")
+            raise PostCreateError("Error copying posts")
+
     async def get_all_posts(self, offset: int, limit: int) -> PaginatedResponse:
         count_result = await self.db.execute(select(func.count()).select_from(PostModel))
         count = count_result.scalar()
@@ -68,6 +143,91 @@ class PostRepository(IPost):
             logging.warning("No posts found")
             return PaginatedResponse(count=count)
 
+    async def get_posts_by_cursor(self, cursor: str | None, limit: int) -> CursorPaginatedResponse:
+        result = await self.db.execute(_apply_cursor(select(PostModel), cursor).limit(limit + 1))
+        posts = result.scalars().all()
+
+        if not posts:
+            logging.warning("No posts found")
+            return CursorPaginatedResponse()
+
+        next_cursor = None
+        if len(posts) > limit:
+            posts = posts[:limit]
+            next_cursor = encode_cursor(posts[-1].created_at, posts[-1].id)
+
+        logging.info(f"Posts retrieved by cursor with count={len(posts)}")
+        return CursorPaginatedResponse(
+            next_cursor=next_cursor,
+            next=get_next_cursor_page(next_cursor, limit, 'posts'),
+            results=[PostEntity.model_validate(post) for post in posts]
+        )
+
+    async def get_public_posts_by_cursor(self,
+                                         cursor: str | None,
+                                         limit: int,
+                                         current_user_id: int | None) -> CursorPaginatedResponse:
+        result = await self.db.execute(_apply_cursor(_post_public_query(current_user_id), cursor).limit(limit + 1))
+        rows = result.all()
+
+        if not rows:
+            logging.warning("No posts found")
+            return CursorPaginatedResponse()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+
+        logging.info(f"Public posts retrieved by cursor with count={len(rows)}")
+        return CursorPaginatedResponse(
+            next_cursor=next_cursor,
+            next=get_next_cursor_page(next_cursor, limit, 'posts/detailed'),
+            results=[PostPublic.model_validate(row._mapping) for row in rows]
+        )
+
+    async def get_public_by_ids(self, post_ids: list[int], current_user_id: int | None) -> list[PostPublic]:
+        if not post_ids:
+            return []
+        result = await self.db.execute(_post_public_query(current_user_id).where(PostModel.id.in_(post_ids)))
+        posts = {row.id: PostPublic.model_validate(row._mapping) for row in result.all()}
+        return [posts[post_id] for post_id in post_ids if post_id in posts]
+
+    async def search(self,
+                     query: str,
+                     cursor: str | None,
+                     limit: int,
+                     current_user_id: int | None) -> CursorPaginatedResponse:
+        rank = func.ts_rank(PostModel.search_vector, func.websearch_to_tsquery(POSTS_SEARCH_CONFIG, query))
+        statement = (
+            _post_public_query(current_user_id)
+            .add_columns(rank.label("rank"))
+            .where(post_search_condition(query))
+            .order_by(rank.desc(), PostModel.id.desc())
+        )
+        if cursor:
+            cursor_rank, post_id = _decode_rank_id_cursor(cursor)
+            statement = statement.where(tuple_(rank, PostModel.id) < tuple_(cursor_rank, post_id))
+
+        result = await self.db.execute(statement.limit(limit + 1))
+        rows = result.all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1].rank, rows[-1].id)
+
+        next_page = get_next_cursor_page(next_cursor, limit, 'posts/search')
+        if next_page:
+            next_page = f'{next_page}&q={quote(query)}'
+
+        logging.info(f"Search found {len(rows)} posts")
+        return CursorPaginatedResponse(
+            next_cursor=next_cursor,
+            next=next_page,
+            results=[PostPublic.model_validate(row._mapping) for row in rows]
+        )
+
     async def get_post(self, post_id: int) -> PostEntity:
         result = await self.db.execute(
             select(PostModel).filter(PostModel.id == post_id)
@@ -78,6 +238,31 @@ class PostRepository(IPost):
             raise PostDoesNotExist("Post does not exist")
         return PostEntity.model_validate(post)
 
+    async def refresh_counters(self, post_ids: list[int]) -> None:
+        # Счетчики пересчитываются по индексам post_id, а не увеличиваются на приращения:
+        # повторный сброс того же снимка после сбоя не накрутит значения
+        likes_count = (
+            select(func.count()).select_from(LikeModel).where(LikeModel.post_id == PostModel.id).scalar_subquery()
+        )
+        comments_count = (
+            select(func.count()).select_from(CommentModel).where(CommentModel.post_id == PostModel.id).scalar_subquery()
+        )
+        statement = (
+            update(PostModel)
+            .where(PostModel.id == any_(bindparam('post_ids', sorted(post_ids), type_=ARRAY(BIGINT))))
+            # updated_at - время правки поста, пересчет счетчиков его не меняет
+            .values(likes_count=likes_count, comments_count=comments_count, updated_at=PostModel.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+        try:
+            await self.db.execute(statement)
+            await self.db.commit()
+            logging.info(f"Counters refreshed for {len(post_ids)} posts")
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            logging.error(f"Error flushing post counters: {str(e)}")
+            raise
+
     async def delete(self, post_id: int, user_id: int) -> None:
         result = await self.db.execute(
             select(PostModel).filter(PostModel.id == post_id)
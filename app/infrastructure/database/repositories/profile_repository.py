@@ -20,6 +20,9 @@ def _profile_query(user_id: int):
             User.first_name,
             User.last_name,
             User.is_active,
+            User.date_joined,
+            User.last_active_time,
+            User.is_superuser,
             func.count(distinct(Subscription.follower_id)).filter(Subscription.followed_user_id == user_id).label(
                 "followers_count"),
             func.count(distinct(Subscription.followed_user_id)).filter(Subscription.follower_id == user_id).label(
@@ -45,4 +48,4 @@ class ProfileRepository(IProfile):
 
         logging.info(f'Profile user with id={user_id} found successfully')
 
-        return ProfilePublic(**profile_data.model_dump())
+        return ProfilePublic.model_validate(profile_data._mapping)
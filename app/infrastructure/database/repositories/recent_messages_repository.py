@@ -0,0 +1,148 @@
+import logging
+from collections import defaultdict
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.domain.dto.pagination import ChatHistoryResponse
+from app.domain.entities.chat import ChatMessage
+from app.domain.repositories.recent_messages import IRecentMessages
+from app.infrastructure.database.repositories.utils.pages import get_message_history_pages
+from app.infrastructure.settings.config import CHAT_RECENT_MESSAGES, CHAT_RECENT_MESSAGES_TTL
+
+# удаленное сообщение оставляет в буфере заглушку со своим номером, чтобы не рвать непрерывность
+_DELETED_PREFIX = 'deleted:'
+
+# Заменяет запись с номером ARGV[1], только если она есть в буфере: иначе буфер ее не покрывает
+_REPLACE_SCRIPT = """
+if redis.call('ZCOUNT', KEYS[1], ARGV[1], ARGV[1]) == 0 then
+    return 0
+end
+redis.call('ZREMRANGEBYSCORE', KEYS[1], ARGV[1], ARGV[1])
+redis.call('ZADD', KEYS[1], ARGV[1], ARGV[2])
+return 1
+"""
+
+
+def _deleted_member(seq: int) -> str:
+    return f'{_DELETED_PREFIX}{seq}'
+
+
+class RecentMessagesRepository(IRecentMessages):
+    """Кольцевой буфер последних сообщений чата в sorted set с номером сообщения в score.
+
+    Сообщения разных воркеров могут дописываться не по порядку номеров, поэтому покрытие
+    промежутка проверяется по непрерывности номеров, а не по порядку записи.
+    Удаленные сообщения хранятся заглушками, которые учитываются в проверке и не попадают в ответ.
+    """
+
+    def __init__(self, redis: Redis):
+        self.redis = redis
+        self.path = "chat.recent"
+
+    def _key(self, chat_id: int) -> str:
+        return f'{self.path}:{chat_id}'
+
+    async def push(self, messages: list[ChatMessage]) -> None:
+        by_chat = defaultdict(dict)
+        for message in messages:
+            by_chat[message.chat_id][message.model_dump_json()] = message.seq
+        await self._add(by_chat)
+
+    async def fill(self, chat_id: int, messages: list[ChatMessage], first_seq: int) -> None:
+        if not messages:
+            return
+        members = {message.model_dump_json(): message.seq for message in messages}
+        # страница из БД полна: номера, которых в ней нет, принадлежат удаленным сообщениям
+        present = set(members.values())
+        for seq in range(first_seq, messages[-1].seq):
+            if seq not in present:
+                members[_deleted_member(seq)] = seq
+        await self._add({chat_id: members})
+
+    async def _add(self, by_chat: dict[int, dict[str, int]]) -> None:
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for chat_id, members in by_chat.items():
+                    key = self._key(chat_id)
+                    pipe.zadd(key, members)
+                    pipe.zremrangebyrank(key, 0, -CHAT_RECENT_MESSAGES - 1)
+                    pipe.expire(key, CHAT_RECENT_MESSAGES_TTL)
+                await pipe.execute()
+        except RedisError as e:
+            # сломанный буфер не должен терять сообщения: без него чтение уйдет в БД
+            logging.error(f"Error pushing recent messages: {e}")
+            for chat_id in by_chat:
+                await self.clear(chat_id)
+
+    async def get_after(self, chat_id: int, seq: int, limit: int) -> list[ChatMessage] | None:
+        try:
+            # буфер ограничен CHAT_RECENT_MESSAGES, поэтому заглушки можно пропускать после чтения
+            members = await self.redis.zrangebyscore(self._key(chat_id), f'({seq}', '+inf', withscores=True)
+            # пустой или истекший буфер ничего не доказывает о новых сообщениях
+            if not members and not await self.redis.exists(self._key(chat_id)):
+                return None
+        except RedisError as e:
+            logging.error(f"Error reading recent messages of chat id={chat_id}: {e}")
+            return None
+
+        messages = []
+        expected = seq + 1
+        for member, score in members:
+            if int(score) != expected:
+                return None
+            expected += 1
+            if not member.startswith(_DELETED_PREFIX):
+                messages.append(ChatMessage.model_validate_json(member))
+                if len(messages) == limit:
+                    break
+        return messages
+
+    async def get_latest(self, chat_id: int, limit: int) -> ChatHistoryResponse | None:
+        try:
+            members = await self.redis.zrevrange(self._key(chat_id), 0, -1, withscores=True)
+        except RedisError as e:
+            logging.error(f"Error reading recent messages of chat id={chat_id}: {e}")
+            return None
+        if not members:
+            return None
+
+        messages = []
+        oldest_seq = int(members[0][1]) + 1
+        for member, score in members:
+            if int(score) != oldest_seq - 1:
+                return None
+            oldest_seq -= 1
+            if not member.startswith(_DELETED_PREFIX):
+                messages.append(ChatMessage.model_validate_json(member))
+                if len(messages) == limit:
+                    break
+        # неполная страница годится, только если буфер начинается с первого сообщения чата
+        if len(messages) < limit and oldest_seq != 1:
+            return None
+        has_older = oldest_seq > 1
+
+        messages.reverse()
+        first_id = messages[0].id if messages else None
+        last_id = messages[-1].id if messages else None
+        prev_page, next_page = get_message_history_pages(chat_id, first_id, last_id, limit, has_older, False)
+        return ChatHistoryResponse(prev=prev_page, next=next_page, results=messages)
+
+    async def replace(self, message: ChatMessage) -> None:
+        await self._replace(message.chat_id, message.seq, message.model_dump_json())
+
+    async def remove(self, message: ChatMessage) -> None:
+        await self._replace(message.chat_id, message.seq, _deleted_member(message.seq))
+
+    async def _replace(self, chat_id: int, seq: int, member: str) -> None:
+        try:
+            await self.redis.eval(_REPLACE_SCRIPT, 1, self._key(chat_id), seq, member)
+        except RedisError as e:
+            logging.error(f"Error replacing recent message seq={seq} of chat id={chat_id}: {e}")
+            await self.clear(chat_id)
+
+    async def clear(self, chat_id: int) -> None:
+        try:
+            await self.redis.delete(self._key(chat_id))
+        except RedisError as e:
+            logging.error(f"Error clearing recent messages of chat id={chat_id}: {e}")
\ No newline at end of file
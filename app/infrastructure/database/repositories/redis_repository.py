@@ -1,36 +1,318 @@
+import asyncio
 import json
 import logging
+import math
+import random
+import struct
+import time
+from collections import Counter
+from typing import Awaitable, Callable
+from uuid import uuid4
 
 from pydantic import BaseModel
 from redis.asyncio import Redis
+from redis.exceptions import RedisError
 
+from app.domain.dto.metrics import CacheStats, CacheTierStats
 from app.domain.repositories.redis import IRedis
+from app.infrastructure.database.repositories.utils.local_cache import local_cache, MISSING
+from app.infrastructure.database.repositories.utils.codecs import get_codec, compress, decompress
+from app.infrastructure.database.repositories.utils.locks import RELEASE_LOCK_SCRIPT
+from app.infrastructure.settings.config import (
+    CACHE_TTL,
+    CACHE_INVALIDATION_CHANNEL,
+    CACHE_LOCK_TTL,
+    CACHE_LOCK_POLL_INTERVAL,
+    CACHE_XFETCH_BETA,
+    CACHE_CODEC,
+    CACHE_COMPRESSION_MIN_SIZE,
+    CACHE_COMPRESSION_LEVEL
+)
+
+# Атомарно удаляет ключи тега вместе с самим тегом: ключ, закешированный во время очистки, не потеряет тег
+_CLEAR_TAG_SCRIPT = """
+local keys = redis.call('SMEMBERS', KEYS[1])
+for i = 1, #keys, 500 do
+    redis.call('DEL', unpack(keys, i, math.min(i + 499, #keys)))
+end
+redis.call('DEL', KEYS[1])
+return keys
+"""
+
+# заголовок записи в Redis: время истечения и длительность загрузки для XFetch
+_ENTRY_HEADER = struct.Struct('!dd')
+
+_codec = get_codec(CACHE_CODEC)
+_stats = Counter()
+# загрузки, выполняющиеся в этом процессе: конкурентные промахи по ключу ждут одну загрузку
+_inflight: dict[str, asyncio.Future] = {}
+
+
+class _Entry:
+    __slots__ = ('payload', 'expires_at', 'delta')
+
+    def __init__(self, payload: bytes, expires_at: float, delta: float):
+        self.payload = payload
+        self.expires_at = expires_at
+        self.delta = delta
+
+    def should_refresh_early(self) -> bool:
+        """XFetch: вероятность пересчета растет по мере приближения к истечению и с длительностью загрузки."""
+        if self.delta <= 0:
+            return False
+        return time.time() - self.delta * CACHE_XFETCH_BETA * math.log(1 - random.random()) >= self.expires_at
+
+
+async def listen_cache_invalidations(redis: Redis) -> None:
+    """Удаляет из локального кеша воркера ключи, инвалидированные любым воркером."""
+    pubsub = redis.pubsub(ignore_subscribe_messages=True)
+    await pubsub.subscribe(CACHE_INVALIDATION_CHANNEL)
+    # сообщения, пропущенные до подписки, не восстановить
+    local_cache.clear()
+    try:
+        async for message in pubsub.listen():
+            local_cache.delete(json.loads(message['data']))
+    finally:
+        await pubsub.aclose()
 
 
 class RedisRepository(IRedis):
+    """Двухуровневый кеш: LRU процесса перед Redis.
+
+    Инвалидация по тегам: тег - set ключей, очистка стоит O(ключей тега) вместо KEYS по всей базе.
+    Очищенные ключи рассылаются через pub/sub, чтобы их удалили локальные кеши всех воркеров.
+    В Redis значение хранится сериализованным (и при большом размере сжатым) вместе со временем
+    истечения и длительностью загрузки для XFetch; оба уровня отдают готовый JSON без валидации.
+    Ожидает клиент Redis без decode_responses.
+    """
+
     def __init__(self, redis: Redis):
         self.cache = redis
+        self.tags_path = "cache.tags"
+        self.locks_path = "cache.locks"
 
-    async def clear_cache(self, path: str) -> None:
-        keys = await self.cache.keys(f"{path}*")
+    def _tag_key(self, tag: str) -> str:
+        return f'{self.tags_path}:{tag}'
+
+    async def _invalidate_local(self, keys: list[str]) -> None:
         if not keys:
-            logging.warning("cache keys to clear not found")
             return
-        logging.info(f"cache keys to clear found")
-        await self.cache.delete(keys)
+        local_cache.delete(keys)
+        await self.cache.publish(CACHE_INVALIDATION_CHANNEL, json.dumps(keys))
 
-    async def get_cache(self, path: str):
+    async def _get_entry(self, path: str) -> _Entry | None:
         try:
             value = await self.cache.get(path)
-            if value:
-                logging.info(f"cache found {path}, value={value}")
-                return json.loads(value)
+        except RedisError as e:
+            logging.error(f"Error getting cache: {e}")
+            return None
+        return self._unpack_entry(path, value)
+
+    async def _set_entry(self, path: str, payload: bytes, tags: list[str] | None, ttl: int, delta: float) -> None:
+        pipe = self.cache.pipeline(transaction=True)
+        pipe.setex(path, ttl, self._pack_entry(payload, ttl, delta))
+        for tag in tags or []:
+            tag_key = self._tag_key(tag)
+            pipe.sadd(tag_key, path)
+            pipe.expire(tag_key, ttl)
+        await pipe.execute()
+        local_cache.set(path, payload)
+        logging.info(f"{path} is cached")
+
+    def _pack_entry(self, payload: bytes, ttl: int, delta: float) -> bytes:
+        return _ENTRY_HEADER.pack(time.time() + ttl, delta) + compress(
+            payload, CACHE_COMPRESSION_MIN_SIZE, CACHE_COMPRESSION_LEVEL
+        )
+
+    def _unpack_entry(self, path: str, value: bytes | None) -> _Entry | None:
+        if not value or len(value) <= _ENTRY_HEADER.size:
             return None
+        expires_at, delta = _ENTRY_HEADER.unpack_from(value)
+        try:
+            return _Entry(decompress(value[_ENTRY_HEADER.size:]), expires_at, delta)
         except Exception as e:
-            print(f"Error getting cache: {e}")
+            # запись старого формата или сжатая zstd без установленного zstandard
+            logging.warning(f"Cache {path} can not be decoded: {e}")
+            return None
+
+    async def clear_cache(self, path: str) -> None:
+        await self.cache.delete(path)
+        await self._invalidate_local([path])
+        logging.info(f"cache {path} cleared")
+
+    async def clear_tag(self, tag: str) -> None:
+        keys = await self.cache.eval(_CLEAR_TAG_SCRIPT, 1, self._tag_key(tag))
+        await self._invalidate_local([key.decode() for key in keys])
+        logging.info(f"{len(keys)} cache keys of tag {tag} cleared")
+
+    async def get_cache(self, path: str):
+        payload = local_cache.get(path)
+        if payload is not MISSING:
+            _stats['local_hits'] += 1
+            return _codec.loads(payload)
+        _stats['local_misses'] += 1
+
+        entry = await self._get_entry(path)
+        if entry is None:
+            _stats['redis_misses'] += 1
             return None
+        _stats['redis_hits'] += 1
+        local_cache.set(path, entry.payload)
+        return _codec.loads(entry.payload)
+
+    async def set_cache(self,
+                        path: str,
+                        value: BaseModel,
+                        tags: list[str] | None = None,
+                        ttl: int | None = None) -> None:
+        await self._set_entry(path, _codec.dumps(value), tags, ttl or CACHE_TTL, 0)
+
+    async def get_many(self, paths: list[str]) -> dict:
+        payloads = {}
+        missing = []
+        for path in dict.fromkeys(paths):
+            payload = local_cache.get(path)
+            if payload is MISSING:
+                missing.append(path)
+            else:
+                payloads[path] = payload
+        _stats['local_hits'] += len(payloads)
+        _stats['local_misses'] += len(missing)
+
+        if missing:
+            try:
+                values = await self.cache.mget(missing)
+            except RedisError as e:
+                logging.error(f"Error getting cache: {e}")
+                values = [None] * len(missing)
+            for path, value in zip(missing, values):
+                entry = self._unpack_entry(path, value)
+                if entry is None:
+                    _stats['redis_misses'] += 1
+                    continue
+                _stats['redis_hits'] += 1
+                local_cache.set(path, entry.payload)
+                payloads[path] = entry.payload
+
+        return {path: _codec.loads(payload) for path, payload in payloads.items()}
+
+    async def set_many(self,
+                       values: dict[str, BaseModel],
+                       tags: list[str] | None = None,
+                       ttl: int | None = None) -> None:
+        if not values:
+            return
+        ttl = ttl or CACHE_TTL
+        payloads = {path: _codec.dumps(value) for path, value in values.items()}
+        # как и в set_cache, ключи и их теги пишутся одной транзакцией
+        pipe = self.cache.pipeline(transaction=True)
+        for path, payload in payloads.items():
+            pipe.setex(path, ttl, self._pack_entry(payload, ttl, 0))
+        for tag in tags or []:
+            tag_key = self._tag_key(tag)
+            pipe.sadd(tag_key, *payloads)
+            pipe.expire(tag_key, ttl)
+        await pipe.execute()
+        for path, payload in payloads.items():
+            local_cache.set(path, payload)
+        logging.info(f"{len(payloads)} values are cached")
+
+    async def delete_many(self, paths: list[str]) -> None:
+        if not paths:
+            return
+        await self.cache.unlink(*paths)
+        await self._invalidate_local(paths)
+        logging.info(f"{len(paths)} cache keys cleared")
+
+    async def get_or_set(self,
+                         path: str,
+                         loader: Callable[[], Awaitable[BaseModel]],
+                         tags: list[str] | None = None,
+                         ttl: int | None = None):
+        return _codec.loads(await self.get_or_set_raw(path, loader, tags, ttl))
+
+    async def get_or_set_raw(self,
+                             path: str,
+                             loader: Callable[[], Awaitable[BaseModel]],
+                             tags: list[str] | None = None,
+                             ttl: int | None = None) -> bytes:
+        payload = local_cache.get(path)
+        if payload is not MISSING:
+            _stats['local_hits'] += 1
+            return payload
+        _stats['local_misses'] += 1
+
+        entry = await self._get_entry(path)
+        if entry is not None and not entry.should_refresh_early():
+            _stats['redis_hits'] += 1
+            local_cache.set(path, entry.payload)
+            return entry.payload
+        _stats['redis_hits' if entry is not None else 'redis_misses'] += 1
+
+        future = _inflight.get(path)
+        if future is not None:
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # загрузка отменена вместе с запросом, который ее начал
+
+        future = asyncio.get_running_loop().create_future()
+        # исключение загрузки получают ожидающие запросы; без них оно не должно попадать в лог как необработанное
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        _inflight[path] = future
+        try:
+            value = await self._load(path, loader, tags, ttl or CACHE_TTL, entry)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            _inflight.pop(path, None)
+
+    async def _load(self, path: str, loader, tags: list[str] | None, ttl: int, stale: _Entry | None) -> bytes:
+        lock_key = f'{self.locks_path}:{path}'
+        token = uuid4().hex
+        try:
+            locked = await self.cache.set(lock_key, token, nx=True, ex=CACHE_LOCK_TTL)
+        except RedisError as e:
+            logging.error(f"Error locking cache {path}: {e}")
+            return _codec.dumps(await loader())
+
+        if locked:
+            try:
+                started_at = time.monotonic()
+                payload = _codec.dumps(await loader())
+                await self._set_entry(path, payload, tags, ttl, time.monotonic() - started_at)
+                return payload
+            finally:
+                try:
+                    await self.cache.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+                except RedisError as e:
+                    logging.error(f"Error unlocking cache {path}: {e}")
+
+        if stale is not None:
+            # значение еще действительно, его досрочно обновляет другой воркер
+            return stale.payload
+
+        deadline = time.monotonic() + CACHE_LOCK_TTL
+        while time.monotonic() < deadline:
+            await asyncio.sleep(CACHE_LOCK_POLL_INTERVAL)
+            entry = await self._get_entry(path)
+            if entry is not None:
+                local_cache.set(path, entry.payload)
+                return entry.payload
+        logging.warning(f"Cache {path} was not loaded by the lock holder in time")
+        return _codec.dumps(await loader())
 
-    async def set_cache(self, path: str, value: BaseModel) -> None:
-        json_value = json.dumps(value.model_dump())
-        await self.cache.setex(path, 600, json_value)
-        logging.info(f"value={json_value} is cached")
+    async def get_stats(self) -> CacheStats:
+        return CacheStats(
+            local=CacheTierStats(hits=_stats['local_hits'], misses=_stats['local_misses']),
+            redis=CacheTierStats(hits=_stats['redis_hits'], misses=_stats['redis_misses']),
+            local_size=len(local_cache)
+        )
\ No newline at end of file
@@ -55,6 +55,22 @@ class SubscriptionRepository(ISubscription):
             logging.info(f'Subscriptions by user_id={current_user_id} issued')
             return PaginatedResponse(count=count)
 
+    async def get_follower_ids(self, followed_user_id: int, limit: int) -> list[int]:
+        result = await self.db.execute(
+            select(SubscriptionModel.follower_id)
+            .filter(SubscriptionModel.followed_user_id == followed_user_id)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def get_followed_user_ids(self, follower_id: int, limit: int) -> list[int]:
+        result = await self.db.execute(
+            select(SubscriptionModel.followed_user_id)
+            .filter(SubscriptionModel.follower_id == follower_id)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
     async def save(self, current_user_id: int, followed_user_id: int) -> SubscriptionEntity:
         subscription = SubscriptionModel(
             follower_id=current_user_id,
@@ -72,7 +88,7 @@ class SubscriptionRepository(ISubscription):
             logging.error('Error creating subscription')
             raise SubscriptionAlreadyExists('Subscription already exists')
 
-    async def delete(self, subscription_id: int, current_user_id: int) -> None:
+    async def delete(self, subscription_id: int, current_user_id: int) -> SubscriptionEntity:
         result = await self.db.execute(
             select(SubscriptionModel).filter(SubscriptionModel.id == subscription_id)
         )
@@ -90,6 +106,7 @@ class SubscriptionRepository(ISubscription):
             await self.db.delete(subscription)
             await self.db.commit()
             logging.info(f'subscription id={subscription_id} deleted')
+            return SubscriptionEntity.model_validate(subscription)
         except SQLAlchemyError as e:
             logging.error(f'some error by delete subscription with id={subscription_id}, error = {e}')
             raise SubscriptionDeleteError("error deleting subscription")
@@ -0,0 +1,80 @@
+import logging
+import math
+import time
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.domain.dto.pagination import PaginatedResponse
+from app.domain.repositories.trending import ITrending
+from app.infrastructure.database.repositories.utils.pages import get_prev_next_pages
+from app.infrastructure.settings.config import (
+    TRENDING_HALF_LIFE,
+    TRENDING_EPOCH,
+    TRENDING_MIN_SCORE,
+    TRENDING_MAX_LENGTH
+)
+
+# score = log2(сумма весов событий * 2^((t - epoch) / half_life)); новое событие прибавляется через logaddexp
+_BUMP_SCRIPT = """
+local added = tonumber(ARGV[2])
+local current = redis.call('ZSCORE', KEYS[1], ARGV[1])
+local score = added
+if current then
+    current = tonumber(current)
+    local high = math.max(current, added)
+    local low = math.min(current, added)
+    score = high + math.log(1 + 2 ^ (low - high)) / math.log(2)
+end
+redis.call('ZADD', KEYS[1], score, ARGV[1])
+"""
+
+
+def _now_score() -> float:
+    return (time.time() - TRENDING_EPOCH) / TRENDING_HALF_LIFE
+
+
+class TrendingRepository(ITrending):
+    """Рейтинг постов в sorted set с экспоненциальным затуханием в логарифмической шкале.
+
+    Порядок по score совпадает с порядком по текущему затухшему весу,
+    поэтому старые записи никогда не пересчитываются.
+    """
+
+    def __init__(self, redis: Redis):
+        self.redis = redis
+        self.key = "trending.posts"
+
+    async def bump(self, post_id: int, weight: float) -> None:
+        try:
+            await self.redis.eval(_BUMP_SCRIPT, 1, self.key, post_id, math.log2(weight) + _now_score())
+        except RedisError as e:
+            logging.error(f"Error bumping trending score of post id={post_id}: {e}")
+
+    async def remove(self, post_id: int) -> None:
+        try:
+            await self.redis.zrem(self.key, post_id)
+        except RedisError as e:
+            logging.error(f"Error removing post id={post_id} from trending: {e}")
+
+    async def get_page(self, offset: int, limit: int) -> PaginatedResponse:
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.zcard(self.key)
+        pipe.zrevrange(self.key, offset, offset + limit - 1)
+        count, post_ids = await pipe.execute()
+
+        prev_page, next_page = get_prev_next_pages(offset, limit, count, 'posts/trending')
+        return PaginatedResponse(
+            count=count,
+            prev=prev_page,
+            next=next_page,
+            results=[int(post_id) for post_id in post_ids]
+        )
+
+    async def trim(self) -> int:
+        min_score = math.log2(TRENDING_MIN_SCORE) + _now_score()
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.zremrangebyscore(self.key, '-inf', f'({min_score}')
+        pipe.zremrangebyrank(self.key, 0, -TRENDING_MAX_LENGTH - 1)
+        removed_stale, removed_overflow = await pipe.execute()
+        return removed_stale + removed_overflow
\ No newline at end of file
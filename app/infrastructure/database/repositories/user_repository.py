@@ -27,10 +27,10 @@ class UserRepository(IUser):
 
     async def get_by_email(self, email: str) -> UserDB:
         result = await self.db.execute(select(UserModel).filter(UserModel.email == email))
-        if not result:
+        user_model = result.scalars().first()
+        if not user_model:
             logging.warning(f'user with email={email} does not exist')
             raise UserDoesNotExist("User with this email does not exist")
-        user_model = result.scalars().first()
         logging.info(f"User with email={email} has been issued")
         return UserDB.model_validate(user_model)
 
@@ -81,3 +81,9 @@ class UserRepository(IUser):
             raise UserDoesNotExist("User with this id does not exist")
         logging.info(f"User with id={user_id} has been issued")
         return UserEntity.model_validate(user)
+
+    async def filter_existing_ids(self, user_ids: list[int]) -> list[int]:
+        if not user_ids:
+            return []
+        result = await self.db.execute(select(UserModel.id).filter(UserModel.id.in_(user_ids)))
+        return list(result.scalars().all())
\ No newline at end of file
@@ -0,0 +1,72 @@
+import json
+import logging
+from typing import Any
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+_PLAIN = b'\x00'
+_ZSTD = b'\x01'
+
+_compressors = {}
+_decompressor = zstandard.ZstdDecompressor() if zstandard is not None else None
+
+
+class JsonCodec:
+    name = 'json'
+
+    def dumps(self, value: Any) -> bytes:
+        if isinstance(value, BaseModel):
+            return value.model_dump_json().encode()
+        return json.dumps(value, separators=(',', ':')).encode()
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    name = 'orjson'
+
+    def dumps(self, value: Any) -> bytes:
+        if isinstance(value, BaseModel):
+            # pydantic сериализует модели в Rust не медленнее orjson и учитывает их типы
+            return value.model_dump_json().encode()
+        return orjson.dumps(value)
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+def get_codec(name: str) -> JsonCodec:
+    if name == 'orjson':
+        if orjson is not None:
+            return OrjsonCodec()
+        logging.warning("orjson is not installed, cache falls back to json codec")
+    return JsonCodec()
+
+
+def compress(payload: bytes, min_size: int, level: int) -> bytes:
+    """Сжимает payload через zstd, если он не меньше min_size и zstandard установлен."""
+    if zstandard is None or not min_size or len(payload) < min_size:
+        return _PLAIN + payload
+    if level not in _compressors:
+        _compressors[level] = zstandard.ZstdCompressor(level=level)
+    return _ZSTD + _compressors[level].compress(payload)
+
+
+def decompress(data: bytes) -> bytes:
+    flag, payload = data[:1], data[1:]
+    if flag == _ZSTD and _decompressor is not None:
+        return _decompressor.decompress(payload)
+    if flag == _PLAIN:
+        return payload
+    raise ValueError("Unknown cache payload format")
\ No newline at end of file
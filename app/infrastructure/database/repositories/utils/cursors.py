@@ -0,0 +1,47 @@
+import json
+import base64
+import binascii
+from datetime import datetime
+
+from app.domain.exceptions.base import InvalidCursorError
+
+
+def encode_cursor(*values) -> str:
+    """Упаковывает значения ключа сортировки в непрозрачную строку для клиента."""
+    parts = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    raw = json.dumps(parts, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str, size: int) -> list:
+    """Распаковывает курсор, созданный encode_cursor, и проверяет количество значений."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        parts = json.loads(raw)
+    except (binascii.Error, ValueError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {e}")
+
+    if not isinstance(parts, list) or len(parts) != size:
+        raise InvalidCursorError("Invalid cursor")
+    return parts
+
+
+def decode_time_id_cursor(cursor: str) -> tuple[datetime, int]:
+    """Распаковывает курсор вида (created_at, id)."""
+    created_at, entity_id = decode_cursor(cursor, 2)
+    try:
+        created_at, entity_id = datetime.fromisoformat(created_at), int(entity_id)
+    except (TypeError, ValueError):
+        raise InvalidCursorError("Invalid cursor")
+    # колонки created_at без часового пояса: сравнение с aware-значением упало бы в БД
+    if created_at.tzinfo is not None:
+        raise InvalidCursorError("Invalid cursor")
+    return created_at, entity_id
+
+
+def decode_id_cursor(cursor: str) -> int:
+    """Распаковывает курсор, состоящий из одного id."""
+    entity_id, = decode_cursor(cursor, 1)
+    if not isinstance(entity_id, int) or isinstance(entity_id, bool):
+        raise InvalidCursorError("Invalid cursor")
+    return entity_id
@@ -0,0 +1,49 @@
+import time
+from collections import OrderedDict
+from typing import Any
+
+from app.infrastructure.settings.config import LOCAL_CACHE_MAX_SIZE, LOCAL_CACHE_TTL
+
+MISSING = object()
+
+
+class LocalCache:
+    """LRU-кеш процесса с ограничением размера и временем жизни записей.
+
+    Работает в одном event loop, поэтому обходится без блокировок.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return MISSING
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return MISSING
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def delete(self, keys: list[str]) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+local_cache = LocalCache(LOCAL_CACHE_MAX_SIZE, LOCAL_CACHE_TTL)
\ No newline at end of file
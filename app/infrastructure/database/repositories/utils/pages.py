@@ -8,4 +8,22 @@ def get_prev_next_pages(offset: int, limit: int, count: int, path_name: str) ->
     prev_page=f"{BASE_URL}/api/{path_name}?offset={prev_offset}&limit={limit}" if prev_offset is not None else None
     next_page=f"{BASE_URL}/api/{path_name}?offset={next_offset}&limit={limit}" if next_offset is not None else None
 
+    return prev_page, next_page
+
+
+def get_next_cursor_page(cursor: str | None, limit: int, path_name: str) -> str | None:
+    if cursor is None:
+        return None
+    return f"{BASE_URL}/api/{path_name}?cursor={cursor}&limit={limit}"
+
+
+def get_message_history_pages(chat_id: int,
+                              first_id: int | None,
+                              last_id: int | None,
+                              limit: int,
+                              has_older: bool,
+                              has_newer: bool) -> tuple[str | None, str | None]:
+    path = f"{BASE_URL}/api/messages/chats_history/{chat_id}"
+    prev_page = f"{path}?before_id={first_id}&limit={limit}" if has_older and first_id is not None else None
+    next_page = f"{path}?after_id={last_id}&limit={limit}" if has_newer and last_id is not None else None
     return prev_page, next_page
\ No newline at end of file
@@ -0,0 +1,45 @@
+import logging
+import time
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.domain.repositories.version import IVersion
+from app.infrastructure.settings.config import ETAG_VERSION_TTL
+
+
+class VersionRepository(IVersion):
+    """Версии данных для ETag: значение - время последнего изменения в наносекундах.
+
+    Отсутствующая версия создается при чтении, поэтому потеря ключа
+    приводит только к смене ETag, а не к устаревшему ответу 304.
+    """
+
+    def __init__(self, redis: Redis):
+        self.redis = redis
+        self.path = "etag.version"
+
+    def _key(self, namespace: str) -> str:
+        return f'{self.path}:{namespace}'
+
+    async def get(self, namespace: str) -> str | None:
+        key = self._key(namespace)
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.set(key, time.time_ns(), nx=True, ex=ETAG_VERSION_TTL)
+        pipe.get(key)
+        try:
+            _, version = await pipe.execute()
+            return version
+        except RedisError as e:
+            logging.error(f"Error getting version of {namespace}: {e}")
+            return None
+
+    async def bump(self, *namespaces: str) -> None:
+        pipe = self.redis.pipeline(transaction=False)
+        version = time.time_ns()
+        for namespace in namespaces:
+            pipe.set(self._key(namespace), version, ex=ETAG_VERSION_TTL)
+        try:
+            await pipe.execute()
+        except RedisError as e:
+            logging.error(f"Error bumping versions of {', '.join(namespaces)}: {e}")
\ No newline at end of file
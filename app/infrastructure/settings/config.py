@@ -28,4 +28,78 @@ ALLOWED_HOSTS = [
     'http://127.0.0.1:5500'
 ]
 
-REDIS_URL = os.getenv('REDIS_URL')
\ No newline at end of file
+REDIS_URL = os.getenv('REDIS_URL')
+CACHE_TTL = 600
+# in-process tier in front of redis; entries of other workers are dropped via pub/sub
+LOCAL_CACHE_MAX_SIZE = 10_000
+LOCAL_CACHE_TTL = 5
+CACHE_INVALIDATION_CHANNEL = 'cache.invalidations'
+# a miss is loaded by one worker under this lock while the others wait for the value
+CACHE_LOCK_TTL = 5
+CACHE_LOCK_POLL_INTERVAL = 0.05
+# XFetch: higher beta refreshes hot entries earlier before they expire
+CACHE_XFETCH_BETA = 1.0
+# not-found results are cached briefly so repeated misses do not reach postgres
+CACHE_NEGATIVE_TTL = 30
+# posts of feed/trending pages are hydrated from cache; counters in them may lag by this long
+POST_PUBLIC_CACHE_TTL = 30
+# 'orjson' falls back to 'json' when orjson is not installed
+CACHE_CODEC = os.getenv('CACHE_CODEC', 'orjson')
+# payloads of at least this size are compressed with zstd when zstandard is installed, 0 disables
+CACHE_COMPRESSION_MIN_SIZE = 4096
+CACHE_COMPRESSION_LEVEL = 3
+
+# home timelines of followers stored in redis
+FEED_TIMELINE_MAX_LENGTH = 800
+FEED_FANOUT_BATCH_SIZE = 1000
+# posts of users with more followers are merged into feeds on read instead of fan-out
+FEED_FANOUT_FOLLOWERS_LIMIT = 10_000
+FEED_CELEBRITY_POSTS_MAX_LENGTH = 100
+# followed users checked for celebrity posts on each feed read
+FEED_FOLLOWED_USERS_LIMIT = 5000
+
+# like/comment counters are accumulated in redis and flushed to posts periodically
+POST_COUNTERS_FLUSH_INTERVAL = 5
+POST_COUNTERS_FLUSH_LOCK_TTL = 60
+
+LIKE_STATUS_CACHE_TTL = 600
+
+# text search configuration of posts.search_vector; changing it requires a migration
+POSTS_SEARCH_CONFIG = 'simple'
+
+# trending score of a post halves every TRENDING_HALF_LIFE seconds
+TRENDING_HALF_LIFE = 6 * 60 * 60
+TRENDING_EPOCH = 1735689600  # 2025-01-01, keeps log-space scores small
+TRENDING_LIKE_WEIGHT = 1.0
+TRENDING_COMMENT_WEIGHT = 2.0
+# posts with a decayed score below the minimum are removed by the trim job
+TRENDING_MIN_SCORE = 0.5
+TRENDING_MAX_LENGTH = 1000
+TRENDING_TRIM_INTERVAL = 300
+
+# rows validated and copied to posts per transaction by the bulk import command
+POSTS_IMPORT_BATCH_SIZE = 5000
+
+# versions behind ETag of read endpoints; expiry bounds staleness after writes bypassing services
+ETAG_VERSION_TTL = 60 * 60
+
+# websocket chat messages are published to '{prefix}:{chat_id}' and delivered by every worker with members of the chat
+CHAT_CHANNEL_PREFIX = 'chat.messages'
+# outgoing websocket messages wait in a bounded queue per connection, drained by its own writer task
+WS_SEND_QUEUE_SIZE = 100
+# when the queue is full: 'drop' skips the message for that connection, 'disconnect' closes the socket
+WS_SLOW_CONSUMER_POLICY = os.getenv('WS_SLOW_CONSUMER_POLICY', 'disconnect')
+# websocket messages are buffered per worker and inserted in batches by a background writer
+CHAT_WRITE_BATCH_SIZE = 500
+CHAT_WRITE_FLUSH_INTERVAL = 0.05
+# frames beyond this many unsaved messages are rejected until the writer catches up
+CHAT_WRITE_BUFFER_SIZE = 10_000
+# 'persisted': a message is broadcast and acked after it is saved;
+# 'fast': it is broadcast at once and acked after saving, so a crash may lose delivered messages;
+# broadcasts carry no id and seq then, so resuming with last_seq is only available with 'persisted'
+CHAT_MESSAGE_GUARANTEE = os.getenv('CHAT_MESSAGE_GUARANTEE', 'persisted')
+# last messages of each chat kept in redis to replay what a reconnecting client missed
+CHAT_RECENT_MESSAGES = 200
+CHAT_RECENT_MESSAGES_TTL = 24 * 60 * 60
+# messages returned by one resume request, the client repeats it with the last seq received
+CHAT_REPLAY_LIMIT = 100
\ No newline at end of file
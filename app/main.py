@@ -8,6 +8,7 @@ from app.api.fast_api.routes.route import setup_routers
 from app.infrastructure.settings.logger import setup_logging
 from app.infrastructure.middlewares.cors import setup_cors
 from app.services.admin.admin import setup_admin
+from app.services.background.tasks import start_background_tasks, stop_background_tasks
 
 setup_logging()
 
@@ -15,7 +16,9 @@ setup_logging()
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logging.info("lifespan started")
+    tasks = start_background_tasks()
     yield
+    await stop_background_tasks(tasks)
     await engine.dispose()
     logging.info("The database connection is disabled")
 
@@ -1,6 +1,7 @@
 from sqladmin import ModelView
 
 from app.infrastructure.database.models import User, Subscription
+from app.services.admin.invalidation import bump_versions, clear_caches
 
 
 class UserAdmin(ModelView, model=User):
@@ -22,6 +23,10 @@ class UserAdmin(ModelView, model=User):
     icon = "fa-solid fa-user"
     category = "accounts"
 
+    async def after_model_delete(self, model, request) -> None:
+        await bump_versions(f'users:{model.id}', f'profiles:{model.id}')
+        await clear_caches(f'cache.users:{model.id}', f'cache.profiles:{model.id}')
+
 
 class SubscriptionAdmin(ModelView, model=Subscription):
     column_list = [
@@ -43,4 +48,12 @@ class SubscriptionAdmin(ModelView, model=Subscription):
     form_excluded_columns = [
         Subscription.created_at,
     ]
-    category = "accounts"
\ No newline at end of file
+    category = "accounts"
+
+    async def after_model_change(self, data, model, is_created, request) -> None:
+        await bump_versions(f'profiles:{model.follower_id}', f'profiles:{model.followed_user_id}')
+        await clear_caches(f'cache.profiles:{model.follower_id}', f'cache.profiles:{model.followed_user_id}')
+
+    async def after_model_delete(self, model, request) -> None:
+        await bump_versions(f'profiles:{model.follower_id}', f'profiles:{model.followed_user_id}')
+        await clear_caches(f'cache.profiles:{model.follower_id}', f'cache.profiles:{model.followed_user_id}')
\ No newline at end of file
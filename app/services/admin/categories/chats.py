@@ -1,6 +1,7 @@
 from sqladmin import ModelView
 
 from app.infrastructure.database.models import Chat, ChatMessage
+from app.services.admin.invalidation import clear_caches, clear_recent_messages
 
 
 class ChatAdmin(ModelView, model=Chat):
@@ -9,11 +10,23 @@ class ChatAdmin(ModelView, model=Chat):
         Chat.first_user_id,
         Chat.second_user_id
     ]
+    form_excluded_columns = [
+        Chat.last_seq
+    ]
     icon = 'fa-solid fa-comment'
     category = 'chats'
 
+    async def after_model_change(self, data, model, is_created, request) -> None:
+        await clear_caches(f'cache.chats:{model.id}')
+
+    async def after_model_delete(self, model, request) -> None:
+        await clear_caches(f'cache.chats:{model.id}')
+        await clear_recent_messages(model.id)
+
 
 class ChatMessageAdmin(ModelView, model=ChatMessage):
+    # номер сообщения выдается только при сохранении через сервис
+    can_create = False
     column_list = [
         ChatMessage.id,
         ChatMessage.chat_id,
@@ -31,8 +44,15 @@ class ChatMessageAdmin(ModelView, model=ChatMessage):
         ChatMessage.sender_id
     ]
     form_excluded_columns = [
+        ChatMessage.seq,
         ChatMessage.created_at,
         ChatMessage.updated_at
     ]
     icon = 'fa-solid fa-comment'
-    category = 'chats'
\ No newline at end of file
+    category = 'chats'
+
+    async def after_model_change(self, data, model, is_created, request) -> None:
+        await clear_recent_messages(model.chat_id)
+
+    async def after_model_delete(self, model, request) -> None:
+        await clear_recent_messages(model.chat_id)
\ No newline at end of file
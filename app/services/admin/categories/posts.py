@@ -1,6 +1,9 @@
 from sqladmin import ModelView
+from sqlalchemy import Select, or_
 
 from app.infrastructure.database.models import Comment, Image, Post, Like
+from app.infrastructure.database.repositories.post_repository import post_search_condition
+from app.services.admin.invalidation import bump_versions, clear_caches, count_post_changes, clear_like_statuses
 
 
 class CommentAdmin(ModelView, model=Comment):
@@ -27,6 +30,19 @@ class CommentAdmin(ModelView, model=Comment):
     icon = 'fa-solid fa-comment'
     category = 'posts'
 
+    # при правке комментарий мог перейти к другому посту: пересчитываются оба
+    async def on_model_change(self, data, model, is_created, request) -> None:
+        if not is_created:
+            await count_post_changes(model.post_id, comments=-1)
+
+    async def after_model_change(self, data, model, is_created, request) -> None:
+        await count_post_changes(model.post_id, comments=1)
+        await bump_versions(f'comments:{model.post_id}')
+
+    async def after_model_delete(self, model, request) -> None:
+        await count_post_changes(model.post_id, comments=-1)
+        await bump_versions(f'comments:{model.post_id}')
+
 
 class ImageAdmin(ModelView, model=Image):
     column_list = [
@@ -49,6 +65,9 @@ class ImageAdmin(ModelView, model=Image):
     icon = 'fa-solid fa-image'
     category = 'posts'
 
+    async def after_model_change(self, data, model, is_created, request) -> None:
+        await clear_caches(f'cache.images:{model.post_id}', f'cache.posts.public:{model.post_id}')
+
 
 class LikeAdmin(ModelView, model=Like):
     column_list = [
@@ -69,6 +88,20 @@ class LikeAdmin(ModelView, model=Like):
     ]
     category = 'posts'
 
+    # при правке лайк мог перейти к другому посту или пользователю: пересчитываются оба
+    async def on_model_change(self, data, model, is_created, request) -> None:
+        if not is_created:
+            await count_post_changes(model.post_id, likes=-1)
+            await clear_like_statuses(model.user_id)
+
+    async def after_model_change(self, data, model, is_created, request) -> None:
+        await count_post_changes(model.post_id, likes=1)
+        await clear_like_statuses(model.user_id)
+
+    async def after_model_delete(self, model, request) -> None:
+        await count_post_changes(model.post_id, likes=-1)
+        await clear_like_statuses(model.user_id)
+
 
 class PostAdmin(ModelView, model=Post):
     column_list = [
@@ -88,6 +121,25 @@ class PostAdmin(ModelView, model=Post):
     ]
     form_excluded_columns = [
         Post.created_at,
-        Post.updated_at
+        Post.updated_at,
+        Post.search_vector,
+        # счетчики ведет отложенный сброс, ручное значение перезаписал бы следующий сброс
+        Post.likes_count,
+        Post.comments_count
     ]
-    category = 'posts'
\ No newline at end of file
+    category = 'posts'
+
+    def search_query(self, stmt: Select, term: str) -> Select:
+        # поиск по тексту через GIN-индекс вместо LIKE по всей таблице
+        conditions = [post_search_condition(term)]
+        if term.isdigit():
+            conditions += [Post.id == int(term), Post.user_id == int(term)]
+        return stmt.filter(or_(*conditions))
+
+    async def after_model_change(self, data, model, is_created, request) -> None:
+        await bump_versions('posts')
+        await clear_caches(f'cache.posts:{model.id}', f'cache.posts.public:{model.id}')
+
+    async def after_model_delete(self, model, request) -> None:
+        await bump_versions('posts', f'comments:{model.id}')
+        await clear_caches(f'cache.posts:{model.id}', f'cache.posts.public:{model.id}')
\ No newline at end of file
@@ -0,0 +1,33 @@
+from app.infrastructure.database.redis import RedisClient
+from app.infrastructure.database.repositories.counter_repository import CounterRepository
+from app.infrastructure.database.repositories.like_status_repository import LikeStatusRepository
+from app.infrastructure.database.repositories.recent_messages_repository import RecentMessagesRepository
+from app.infrastructure.database.repositories.redis_repository import RedisRepository
+from app.infrastructure.database.repositories.version_repository import VersionRepository
+
+
+async def bump_versions(*namespaces: str) -> None:
+    """Сбрасывает ETag публичных эндпоинтов после правок через админку."""
+    await VersionRepository(RedisClient.get_redis()).bump(*namespaces)
+
+
+async def clear_caches(*paths: str) -> None:
+    """Удаляет закешированные сервисами объекты после правок через админку."""
+    await RedisRepository(RedisClient.get_binary_redis()).delete_many(list(paths))
+
+
+async def clear_recent_messages(chat_id: int) -> None:
+    """Сбрасывает буфер последних сообщений чата после правки сообщений через админку."""
+    await RecentMessagesRepository(RedisClient.get_redis()).clear(chat_id)
+
+
+async def count_post_changes(post_id: int, likes: int = 0, comments: int = 0) -> None:
+    """Передает правку лайков и комментариев через админку в отложенный сброс счетчиков поста."""
+    await CounterRepository(RedisClient.get_redis()).incr(post_id, likes=likes, comments=comments)
+
+
+async def clear_like_statuses(*user_ids: int) -> None:
+    """Сбрасывает кэш отметок "нравится" пользователей после правки лайков через админку."""
+    repository = LikeStatusRepository(RedisClient.get_redis())
+    for user_id in set(user_ids):
+        await repository.clear(user_id)
\ No newline at end of file
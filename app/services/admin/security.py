@@ -4,7 +4,9 @@ import logging
 from fastapi import Request
 from sqladmin.authentication import AuthenticationBackend
 
+from app.dependencies.redis import get_redis
 from app.dependencies.services.user import get_user_service
+from app.domain.exceptions.user import UserDoesNotExist
 from app.infrastructure.database.database import AsyncSessionLocal
 from app.infrastructure.database.models import User
 from app.infrastructure.settings.security import verify_password, create_access_token
@@ -13,9 +15,12 @@ from app.infrastructure.settings.config import AUTH_KEY, HASHING_ALGORITHM
 
 async def authenticate_user(email: str, password: str) -> User | None:
     async with AsyncSessionLocal() as session:
-        user_service = get_user_service(session)
-        user = await user_service._get_by_email(email)
-        if not user or not verify_password(password, user.password_hash):
+        user_service = get_user_service(session, await get_redis())
+        try:
+            user = await user_service._get_for_login(email)
+        except UserDoesNotExist:
+            return None
+        if not verify_password(password, user.password_hash):
             return None
         return user
 
@@ -28,9 +33,12 @@ async def get_user_from_token(token: str) -> User | None:
             return None
 
         async with AsyncSessionLocal() as session:
-            user_service = get_user_service(session)
-            user = await user_service._get_by_email(email)
-            return user if user and user.is_superuser else None
+            user_service = get_user_service(session, await get_redis())
+            try:
+                user = await user_service._get_by_email(email)
+            except UserDoesNotExist:
+                return None
+            return user if user.is_superuser else None
     except Exception as e:
         logging.error(e)
 
@@ -0,0 +1,110 @@
+import asyncio
+import logging
+
+from app.domain.dto.chat import ChatMessageCreate
+from app.domain.entities.chat import ChatMessage
+from app.domain.exceptions.base import DomainError
+from app.domain.exceptions.chat import MessageCreateError
+from app.infrastructure.database.database import AsyncSessionLocal
+from app.infrastructure.database.redis import RedisClient
+from app.infrastructure.database.repositories.chat_message_repository import ChatMessageRepository
+from app.infrastructure.database.repositories.chat_repository import ChatRepository
+from app.infrastructure.database.repositories.recent_messages_repository import RecentMessagesRepository
+from app.infrastructure.database.repositories.redis_repository import RedisRepository
+from app.infrastructure.settings.config import (
+    CHAT_WRITE_BATCH_SIZE,
+    CHAT_WRITE_BUFFER_SIZE,
+    CHAT_WRITE_FLUSH_INTERVAL
+)
+from app.services.core_services.chat_service import ChatService
+
+
+class ChatMessageWriter:
+    """Write-behind буфер сообщений из сокетов.
+
+    Сообщения копятся в памяти воркера и сохраняются пачками одним INSERT в фоновой задаче;
+    submit возвращает future, который получит сохраненное сообщение с id или ошибку.
+    Несохраненные сообщения теряются при аварийном завершении процесса.
+    """
+
+    def __init__(self):
+        self._pending: list[tuple[ChatMessageCreate, asyncio.Future]] = []
+        self._ready = asyncio.Event()
+        # запись, начатая в run: при остановке ее дожидаются, а не бросают
+        self._flushing: asyncio.Task | None = None
+
+    def submit(self, message: ChatMessageCreate) -> asyncio.Future:
+        if len(self._pending) >= CHAT_WRITE_BUFFER_SIZE:
+            raise MessageCreateError("Сервер перегружен, повторите отправку позже")
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((message, future))
+        self._ready.set()
+        return future
+
+    async def run(self) -> None:
+        while True:
+            await self._ready.wait()
+            # короткая пауза собирает в пачку сообщения всех сокетов воркера
+            await asyncio.sleep(CHAT_WRITE_FLUSH_INTERVAL)
+            self._flushing = asyncio.create_task(self._flush_pending())
+            try:
+                # отмена задачи при остановке не должна прерывать начатую запись
+                await asyncio.shield(self._flushing)
+            except asyncio.CancelledError:
+                await self._flushing
+                raise
+
+    async def flush(self) -> None:
+        """Дожидается начатой записи и сохраняет оставшиеся сообщения; вызывается при остановке."""
+        if self._flushing is not None:
+            await self._flushing
+        await self._flush_pending()
+
+    async def _flush_pending(self) -> None:
+        while self._pending:
+            batch = self._pending[:CHAT_WRITE_BATCH_SIZE]
+            del self._pending[:CHAT_WRITE_BATCH_SIZE]
+            await self._write(batch)
+        self._ready.clear()
+
+    async def _write(self, batch: list[tuple[ChatMessageCreate, asyncio.Future]]) -> None:
+        try:
+            async with AsyncSessionLocal() as session:
+                service = ChatService(ChatRepository(session),
+                                      ChatMessageRepository(session),
+                                      RedisRepository(RedisClient.get_binary_redis()),
+                                      RecentMessagesRepository(RedisClient.get_redis()))
+                try:
+                    saved = await service.create_messages([message for message, _ in batch])
+                except MessageCreateError:
+                    # одно сообщение в удаленный чат не должно отменять остальные
+                    await self._write_one_by_one(service, batch)
+                    return
+        except Exception as e:
+            logging.error(f"Failed to save {len(batch)} chat messages: {e}")
+            for _, future in batch:
+                _resolve(future, error=MessageCreateError("Ошибка при создании сообщения"))
+            return
+
+        for (_, future), message in zip(batch, saved):
+            _resolve(future, result=message)
+
+    async def _write_one_by_one(self, service: ChatService,
+                                batch: list[tuple[ChatMessageCreate, asyncio.Future]]) -> None:
+        for message, future in batch:
+            try:
+                _resolve(future, result=await service.create_message(message))
+            except DomainError as e:
+                _resolve(future, error=e)
+
+
+def _resolve(future: asyncio.Future, result: ChatMessage | None = None, error: Exception | None = None) -> None:
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+chat_message_writer = ChatMessageWriter()
\ No newline at end of file
@@ -0,0 +1,80 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+from app.infrastructure.database.database import AsyncSessionLocal
+from app.infrastructure.database.redis import RedisClient
+from app.infrastructure.database.repositories.counter_repository import CounterRepository
+from app.infrastructure.database.repositories.like_repository import LikeRepository
+from app.infrastructure.database.repositories.post_repository import PostRepository
+from app.infrastructure.database.repositories.redis_repository import RedisRepository, listen_cache_invalidations
+from app.infrastructure.database.repositories.trending_repository import TrendingRepository
+from app.infrastructure.database.repositories.version_repository import VersionRepository
+from app.infrastructure.settings.config import POST_COUNTERS_FLUSH_INTERVAL, TRENDING_TRIM_INTERVAL
+from app.services.background.message_writer import chat_message_writer
+from app.services.core_services.counter_service import CounterService
+from app.services.core_services.public_post_service import PublicPostService
+from app.services.core_services.trending_service import TrendingService
+from app.services.websockets.manager import websocket_manager
+
+
+async def flush_post_counters() -> None:
+    async with AsyncSessionLocal() as session:
+        service = CounterService(CounterRepository(RedisClient.get_redis()),
+                                 PostRepository(session),
+                                 VersionRepository(RedisClient.get_redis()))
+        await service.flush()
+
+
+async def trim_trending_posts() -> None:
+    # сессия не открывает соединение, пока сервис не обратится к БД, а trim работает только с redis
+    async with AsyncSessionLocal() as session:
+        public_post_service = PublicPostService(PostRepository(session),
+                                                LikeRepository(session),
+                                                RedisRepository(RedisClient.get_binary_redis()))
+        service = TrendingService(TrendingRepository(RedisClient.get_redis()), public_post_service)
+        removed = await service.trim()
+    logging.info(f"{removed} posts removed from trending")
+
+
+async def listen_invalidations() -> None:
+    await listen_cache_invalidations(RedisClient.get_redis())
+
+
+async def listen_chat_messages() -> None:
+    await websocket_manager.listen(RedisClient.get_redis())
+
+
+async def _run_periodically(name: str, job: Callable[[], Awaitable[None]], interval: float) -> None:
+    while True:
+        try:
+            await job()
+        except Exception as e:
+            logging.error(f"Background task {name} failed: {e}")
+        await asyncio.sleep(interval)
+
+
+def start_background_tasks() -> list[asyncio.Task]:
+    tasks = [
+        asyncio.create_task(_run_periodically("flush_post_counters", flush_post_counters, POST_COUNTERS_FLUSH_INTERVAL)),
+        asyncio.create_task(_run_periodically("trim_trending_posts", trim_trending_posts, TRENDING_TRIM_INTERVAL)),
+        # слушатель работает бесконечно и перезапускается только после обрыва соединения
+        asyncio.create_task(_run_periodically("listen_invalidations", listen_invalidations, 1)),
+        asyncio.create_task(_run_periodically("listen_chat_messages", listen_chat_messages, 1)),
+        asyncio.create_task(_run_periodically("write_chat_messages", chat_message_writer.run, 1)),
+    ]
+    logging.info(f"{len(tasks)} background tasks started")
+    return tasks
+
+
+async def stop_background_tasks(tasks: list[asyncio.Task]) -> None:
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    try:
+        # последний сброс, чтобы не потерять приращения при остановке
+        await flush_post_counters()
+    except Exception as e:
+        logging.error(f"Final flush of post counters failed: {e}")
+    await chat_message_writer.flush()
+    logging.info("Background tasks stopped")
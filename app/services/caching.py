@@ -0,0 +1,110 @@
+import functools
+import inspect
+from typing import Awaitable, Callable
+
+from pydantic import BaseModel
+
+from app.domain.exceptions.base import DomainError
+from app.infrastructure.settings.config import CACHE_NEGATIVE_TTL
+
+
+class CachedNotFound(BaseModel):
+    """Отрицательная запись кеша: объект не найден."""
+    not_found: str
+
+
+def _format_path(path: str, func: Callable, args: tuple, kwargs: dict, **extra) -> str:
+    bound = inspect.signature(func).bind(*args, **kwargs)
+    bound.apply_defaults()
+    arguments = dict(bound.arguments)
+    arguments.pop('self', None)
+    return path.format(**arguments, **extra)
+
+
+async def _remember_not_found(cache_port, key: str, error: DomainError, ttl: int) -> None:
+    await cache_port.set_cache(key, CachedNotFound(not_found=error.message), ttl=ttl)
+
+
+def cached(path: str,
+           model: type[BaseModel],
+           not_found: type[DomainError] | None = None,
+           ttl: int | None = None,
+           negative_ttl: int = CACHE_NEGATIVE_TTL):
+    """Read-through кеш метода сервиса через self.cache_port.
+
+    path - шаблон ключа с аргументами метода, например 'cache.posts:{post_id}'.
+    Исключение not_found кешируется на negative_ttl и повторяется при попадании.
+    """
+    def decorator(func: Callable[..., Awaitable[BaseModel]]):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            key = _format_path(path, func, (self, *args), kwargs)
+            try:
+                value = await self.cache_port.get_or_set(key, lambda: func(self, *args, **kwargs), ttl=ttl)
+            except Exception as e:
+                if not_found is not None and isinstance(e, not_found):
+                    await _remember_not_found(self.cache_port, key, e, negative_ttl)
+                raise
+
+            if not_found is not None and 'not_found' in value:
+                raise not_found(value['not_found'])
+            return model.model_validate(value)
+        return wrapper
+    return decorator
+
+
+def cached_not_found(path: str, not_found: type[DomainError], ttl: int = CACHE_NEGATIVE_TTL):
+    """Кеширует только промахи метода: найденные объекты всегда читаются из порта.
+
+    Подходит для списков и объектов, которые нельзя держать в кеше целиком (например, с хешем пароля).
+    Пока запись жива, повторный промах стоит одной проверки локального кеша или GET в redis.
+    """
+    def decorator(func: Callable[..., Awaitable]):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            key = _format_path(path, func, (self, *args), kwargs)
+            value = await self.cache_port.get_cache(key)
+            if value is not None:
+                raise not_found(value['not_found'])
+            try:
+                return await func(self, *args, **kwargs)
+            except not_found as e:
+                await _remember_not_found(self.cache_port, key, e, ttl)
+                raise
+        return wrapper
+    return decorator
+
+
+async def get_many_cached(cache_port,
+                          path: str,
+                          ids: list[int],
+                          loader: Callable[[list[int]], Awaitable[dict[int, BaseModel]]],
+                          model: type[BaseModel],
+                          ttl: int | None = None) -> dict:
+    """Пакетный read-through: попадания читаются одним MGET, в loader уходят только промахи.
+
+    path - шаблон ключа с {id}, например 'cache.posts.public:{id}'; loader возвращает {id: value}.
+    """
+    keys = {id_: path.format(id=id_) for id_ in dict.fromkeys(ids)}
+    cached_values = await cache_port.get_many(list(keys.values()))
+    values = {id_: model.model_validate(cached_values[key]) for id_, key in keys.items() if key in cached_values}
+
+    missing_ids = [id_ for id_ in keys if id_ not in values]
+    if missing_ids:
+        loaded = await loader(missing_ids)
+        await cache_port.set_many({keys[id_]: value for id_, value in loaded.items()}, ttl=ttl)
+        values.update(loaded)
+    return values
+
+
+def invalidates(*paths: str):
+    """Удаляет ключи кеша после успешного выполнения метода; в шаблонах доступен его результат как result."""
+    def decorator(func: Callable[..., Awaitable]):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            result = await func(self, *args, **kwargs)
+            keys = [_format_path(path, func, (self, *args), kwargs, result=result) for path in paths]
+            await self.cache_port.delete_many(keys)
+            return result
+        return wrapper
+    return decorator
\ No newline at end of file
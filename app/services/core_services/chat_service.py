@@ -1,75 +1,120 @@
 from app.domain.entities.chat import Chat, ChatMessage
 from app.domain.dto.chat import ChatCreate
-from app.domain.dto.pagination import PaginatedResponse
 from app.domain.dto.chat import ChatMessageCreate, ChatMessageUpdate
+from app.domain.dto.pagination import ChatHistoryResponse
 from app.domain.exceptions.base import AccessError
+from app.domain.exceptions.chat import ChatDoesNotExist
 from app.domain.repositories.chat import IChat
 from app.domain.repositories.chat_message import IChatMessage
+from app.domain.repositories.recent_messages import IRecentMessages
 from app.domain.repositories.redis import IRedis
+from app.services.caching import cached
 
 
 class ChatService:
     def __init__(self, 
                  chat_port: IChat, 
                  chat_message_port: IChatMessage,
-                 cache_port: IRedis
+                 cache_port: IRedis,
+                 recent_messages_port: IRecentMessages
                  ) -> None:
         self.chat_port = chat_port
         self.chat_message_port = chat_message_port
         self.cache_port = cache_port
+        self.recent_messages_port = recent_messages_port
         self.cache_path = "cache.messages"
 
     async def init_chat(self, current_user_id: int, target_user_id: int) -> Chat:
         chat_create = ChatCreate(first_user_id=current_user_id, second_user_id=target_user_id)
         results = await self.chat_port.save(chat_create)
-        await self.cache_port.clear_cache( f'{self.cache_path}:chats:{current_user_id}')
+        await self.cache_port.clear_tag(f'{self.cache_path}:chats:{current_user_id}')
+        await self.cache_port.clear_tag(f'{self.cache_path}:chats:{target_user_id}')
+        await self.cache_port.clear_cache(f'cache.chats:{results.id}')
         return results
 
+    # участники чата не меняются, поэтому проверка доступа к чату не ходит в БД
+    @cached('cache.chats:{chat_id}', Chat, not_found=ChatDoesNotExist)
+    async def get_by_id(self, chat_id: int) -> Chat:
+        return await self.chat_port.get_by_id(chat_id)
+
     async def is_user_chat(self, user_id: int, chat_id: int) -> bool:
-        chat = await self.chat_port.get_by_id(chat_id)
+        chat = await self.get_by_id(chat_id)
         if not chat:
             return False
         return user_id in (chat.first_user_id, chat.second_user_id)
 
     async def delete_chat(self, chat_id: int, current_user_id: int) -> None:
-        await self.cache_port.clear_cache(f'{self.cache_path}:{chat_id}')
+        chat = await self.chat_port.get_by_id(chat_id)
         await self.chat_port.delete(chat_id, current_user_id)
+        await self.cache_port.clear_tag(f'{self.cache_path}:chats:{chat.first_user_id}')
+        await self.cache_port.clear_tag(f'{self.cache_path}:chats:{chat.second_user_id}')
+        await self.cache_port.clear_cache(f'cache.chats:{chat_id}')
+        await self.recent_messages_port.clear(chat_id)
 
-    async def get_chats_by_user_id(self, current_user_id: int, offset: int, limit: int) -> PaginatedResponse:
-        cache_key = f'{self.cache_path}:chats:{current_user_id}'
-        results = await self.cache_port.get_cache(cache_key)
-        if results:
-            return PaginatedResponse(**results)
-        results = await self.chat_port.get_all_by_user_id(current_user_id, offset, limit)
-        await self.cache_port.set_cache(cache_key, results)
-        return results
+    async def get_chats_by_user_id(self, current_user_id: int, offset: int, limit: int) -> bytes:
+        """Возвращает PaginatedResponse, сериализованный в JSON."""
+        return await self.cache_port.get_or_set_raw(
+            f'{self.cache_path}:chats:{current_user_id}:{offset}:{limit}',
+            lambda: self.chat_port.get_all_by_user_id(current_user_id, offset, limit),
+            tags=[f'{self.cache_path}:chats:{current_user_id}']
+        )
 
-    async def get_chat_messages(self, user_id: int, chat_id: int, offset: int, limit: int) -> PaginatedResponse:
+    async def get_chat_messages(self,
+                                user_id: int,
+                                chat_id: int,
+                                before_id: int | None,
+                                after_id: int | None,
+                                limit: int) -> ChatHistoryResponse:
+        """Без курсора отдает последние сообщения из буфера Redis; БД читается при его промахе и для старых страниц."""
         if not await self.is_user_chat(user_id, chat_id):
             raise AccessError("You have not access to this chat")
 
-        cache_key = f'{self.cache_path}:{chat_id}:{offset}:{limit}'
-        cache_messages = await self.cache_port.get_cache(cache_key)
-        if cache_messages:
-            return PaginatedResponse(**cache_messages)
-        messages = await self.chat_message_port.get_by_chat_id(chat_id, offset, limit)
-        await self.cache_port.set_cache(cache_key, messages)
+        latest = before_id is None and after_id is None
+        if latest:
+            page = await self.recent_messages_port.get_latest(chat_id, limit)
+            if page is not None:
+                return page
+
+        page = await self.chat_message_port.get_history(chat_id, before_id, after_id, limit)
+        if latest and page.results:
+            # без более старых сообщений страница покрывает чат с первого номера
+            first_seq = 1 if page.prev is None else page.results[0].seq
+            await self.recent_messages_port.fill(chat_id, page.results, first_seq)
+        return page
+
+    async def get_messages_after(self, user_id: int, chat_id: int, last_seq: int, limit: int) -> list[ChatMessage]:
+        if not await self.is_user_chat(user_id, chat_id):
+            raise AccessError("You have not access to this chat")
+        return await self.replay(chat_id, last_seq, limit)
+
+    async def replay(self, chat_id: int, last_seq: int, limit: int) -> list[ChatMessage]:
+        """Сообщения после last_seq: из буфера последних сообщений, а если он не покрывает промежуток - из БД."""
+        messages = await self.recent_messages_port.get_after(chat_id, last_seq, limit)
+        if messages is None:
+            messages = await self.chat_message_port.get_after_seq(chat_id, last_seq, limit)
         return messages
 
     async def create_message(self, message: ChatMessageCreate) -> ChatMessage | None:
-        await self.cache_port.clear_cache(f'{self.cache_path}:{message.chat_id}')
-        return await self.chat_message_port.save(message)
+        result = await self.chat_message_port.save(message)
+        await self.recent_messages_port.push([result])
+        return result
+
+    async def create_messages(self, messages: list[ChatMessageCreate]) -> list[ChatMessage]:
+        results = await self.chat_message_port.save_many(messages)
+        await self.recent_messages_port.push(results)
+        return results
 
     async def update_message(self, message: ChatMessageUpdate, current_user_id: int) -> ChatMessage:
-        if message.user_id != current_user_id:
+        existing = await self.chat_message_port.get_message_by_id(message.id)
+        if existing.sender_id != current_user_id:
             raise AccessError("You have not access to this chat")
         message = await self.chat_message_port.update(message, current_user_id)
-        await self.cache_port.clear_cache(f'{self.cache_path}:{message.chat_id}')
+        await self.recent_messages_port.replace(message)
         return message
 
     async def delete_message(self, message_id: int, current_user_id: int) -> None:
         message = await self.chat_message_port.get_message_by_id(message_id)
-        if message.user_id != current_user_id:
+        if message.sender_id != current_user_id:
             raise AccessError("You have not access to this message")
         await self.chat_message_port.delete(message.id, current_user_id)
-        await self.cache_port.clear_cache(f'{self.cache_path}:{message.chat_id}')
+        await self.recent_messages_port.remove(message)
@@ -2,20 +2,40 @@ from app.domain.repositories.comment import IComment
 from app.domain.dto.comment import CommentCreate, CommentUpdate
 from app.domain.dto.pagination import PaginatedResponse
 from app.domain.entities.comment import Comment
+from app.domain.repositories.counter import ICounter
+from app.domain.repositories.trending import ITrending
+from app.domain.repositories.version import IVersion
+from app.infrastructure.settings.config import TRENDING_COMMENT_WEIGHT
 
 
 class CommentService:
-    def __init__(self, comment_port: IComment):
+    def __init__(self,
+                 comment_port: IComment,
+                 counter_port: ICounter,
+                 trending_port: ITrending,
+                 version_port: IVersion):
         self.comment_port = comment_port
+        self.counter_port = counter_port
+        self.trending_port = trending_port
+        self.version_port = version_port
+        self.version_path = "comments"
         
     async def save(self, comment: CommentCreate, current_user_id: int) -> Comment:
-        return await self.comment_port.save(comment, current_user_id)
+        result = await self.comment_port.save(comment, current_user_id)
+        await self.counter_port.incr(comment.post_id, comments=1)
+        await self.trending_port.bump(comment.post_id, TRENDING_COMMENT_WEIGHT)
+        await self.version_port.bump(f'{self.version_path}:{comment.post_id}')
+        return result
 
     async def get_all_by_post_id(self, post_id: int, offset: int, limit: int) -> PaginatedResponse:
         return await self.comment_port.get_all_by_post_id(post_id, offset, limit)
     
     async def update(self, comment: CommentUpdate, current_user_id: int) -> Comment:
-        return await self.comment_port.update(comment, current_user_id)
+        result = await self.comment_port.update(comment, current_user_id)
+        await self.version_port.bump(f'{self.version_path}:{result.post_id}')
+        return result
     
     async def delete(self, comment_id, current_user_id) -> None:
-        await self.comment_port.delete(comment_id, current_user_id)
\ No newline at end of file
+        comment = await self.comment_port.delete(comment_id, current_user_id)
+        await self.counter_port.incr(comment.post_id, comments=-1)
+        await self.version_port.bump(f'{self.version_path}:{comment.post_id}')
\ No newline at end of file
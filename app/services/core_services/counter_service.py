@@ -0,0 +1,31 @@
+from app.domain.repositories.counter import ICounter
+from app.domain.repositories.post import IPost
+from app.domain.repositories.version import IVersion
+
+
+class CounterService:
+    def __init__(self, counter_port: ICounter, post_port: IPost, version_port: IVersion) -> None:
+        self.counter_port = counter_port
+        self.post_port = post_port
+        self.version_port = version_port
+
+    async def flush(self) -> None:
+        """Обновляет счетчики постов, у которых в кэше накопились приращения лайков и комментариев.
+
+        Приращения служат только списком затронутых постов: значения пересчитываются в БД,
+        поэтому снимок, не подтвержденный из-за сбоя, можно безопасно применить повторно.
+        """
+        token = await self.counter_port.acquire_flush_lock()
+        if token is None:
+            return
+        try:
+            deltas = await self.counter_port.take_pending()
+            if deltas:
+                await self.post_port.refresh_counters(list(deltas))
+                # count и ссылка next списка комментариев берутся из comments_count: ETag меняется вместе с ним
+                commented_ids = [post_id for post_id, delta in deltas.items() if 'comments' in delta]
+                if commented_ids:
+                    await self.version_port.bump(*[f'comments:{post_id}' for post_id in commented_ids])
+            await self.counter_port.ack_pending()
+        finally:
+            await self.counter_port.release_flush_lock(token)
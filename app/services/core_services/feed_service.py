@@ -0,0 +1,47 @@
+import heapq
+
+from app.domain.dto.pagination import CursorPaginatedResponse
+from app.domain.repositories.feed import IFeed
+from app.domain.repositories.subscription import ISubscription
+from app.infrastructure.settings.config import FEED_FOLLOWED_USERS_LIMIT
+from app.services.core_services.public_post_service import PublicPostService
+
+
+def _merge_post_ids(sources: list[list[int]], limit: int) -> list[int]:
+    """K-way слияние отсортированных по убыванию списков id постов без повторов."""
+    post_ids = []
+    for post_id in heapq.merge(*sources, reverse=True):
+        if post_ids and post_ids[-1] == post_id:
+            continue
+        post_ids.append(post_id)
+        if len(post_ids) == limit:
+            break
+    return post_ids
+
+
+class FeedService:
+    def __init__(self,
+                 feed_port: IFeed,
+                 subscription_port: ISubscription,
+                 public_post_service: PublicPostService) -> None:
+        self.feed_port = feed_port
+        self.subscription_port = subscription_port
+        self.public_post_service = public_post_service
+
+    async def _get_post_ids(self, user_id: int, cursor: str | None, limit: int) -> list[int]:
+        post_ids = await self.feed_port.get_post_ids(user_id, cursor, limit)
+
+        # подписки пользователя ограничены, в отличие от общего множества популярных авторов
+        followed_ids = await self.subscription_port.get_followed_user_ids(user_id, FEED_FOLLOWED_USERS_LIMIT)
+        followed_celebrity_ids = await self.feed_port.filter_celebrity_ids(followed_ids)
+        if not followed_celebrity_ids:
+            return post_ids
+
+        celebrity_post_ids = await self.feed_port.get_celebrity_post_ids(followed_celebrity_ids, cursor, limit)
+        return _merge_post_ids([post_ids, *celebrity_post_ids], limit)
+
+    async def get_feed(self, user_id: int, cursor: str | None, limit: int) -> CursorPaginatedResponse:
+        post_ids = await self._get_post_ids(user_id, cursor, limit)
+        page = self.feed_port.get_page(post_ids, limit)
+        page.results = await self.public_post_service.get_by_ids(post_ids, user_id)
+        return page
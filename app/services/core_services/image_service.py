@@ -1,14 +1,20 @@
 from app.domain.dto.image import CreateImage
 from app.domain.entities.image import Image
+from app.domain.exceptions.image import ImageNotFoundError
 from app.domain.repositories.image import IImage
+from app.domain.repositories.redis import IRedis
+from app.services.caching import cached_not_found, invalidates
 
 
 class ImageService:
-    def __init__(self, image_port: IImage):
+    def __init__(self, image_port: IImage, cache_port: IRedis):
         self.image_port = image_port
+        self.cache_port = cache_port
 
+    @invalidates('cache.images:{image.post_id}', 'cache.posts.public:{image.post_id}')
     async def upload(self, image: CreateImage) -> Image:
         return await self.image_port.upload(image)
 
+    @cached_not_found('cache.images:{post_id}', ImageNotFoundError)
     async def get_sources_by_post_id(self, post_id: int) -> list[Image]:
-        return await self.image_port.get_sources_by_post_id(post_id)
+        return await self.image_port.get_sources_by_post_id(post_id)
\ No newline at end of file
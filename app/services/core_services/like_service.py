@@ -1,17 +1,57 @@
 from app.domain.entities.like import Like
 from app.domain.dto.pagination import PaginatedResponse
 from app.domain.repositories.like import ILike
+from app.domain.repositories.counter import ICounter
+from app.domain.repositories.like_status import ILikeStatus
+from app.domain.repositories.trending import ITrending
+from app.infrastructure.settings.config import TRENDING_LIKE_WEIGHT
 
 
 class LikeService:
-    def __init__(self, like_port: ILike):
+    def __init__(self,
+                 like_port: ILike,
+                 counter_port: ICounter,
+                 like_status_port: ILikeStatus,
+                 trending_port: ITrending):
         self.like_port = like_port
+        self.counter_port = counter_port
+        self.like_status_port = like_status_port
+        self.trending_port = trending_port
 
     async def save(self, post_id: int, current_user_id: int) -> Like:
-        return await self.like_port.save(post_id, current_user_id)
+        like = await self.like_port.save(post_id, current_user_id)
+        await self.counter_port.incr(post_id, likes=1)
+        await self.trending_port.bump(post_id, TRENDING_LIKE_WEIGHT)
+        await self.like_status_port.set(current_user_id, {post_id: True})
+        return like
+
+    async def like(self, post_id: int, current_user_id: int) -> bool:
+        created = await self.like_port.like(post_id, current_user_id)
+        if created:
+            await self.counter_port.incr(post_id, likes=1)
+            await self.trending_port.bump(post_id, TRENDING_LIKE_WEIGHT)
+        await self.like_status_port.set(current_user_id, {post_id: True})
+        return True
+
+    async def unlike(self, post_id: int, current_user_id: int) -> bool:
+        deleted = await self.like_port.unlike(post_id, current_user_id)
+        if deleted:
+            await self.counter_port.incr(post_id, likes=-1)
+        await self.like_status_port.set(current_user_id, {post_id: False})
+        return False
 
     async def get_all_by_post_id(self, post_id: int, offset: int, limit: int) -> PaginatedResponse:
         return await self.like_port.get_all_by_post_id(post_id, offset, limit)
 
-    async def delete(self, like_id: int, current_user_id: int) -> None:
-        await self.like_port.delete(like_id, current_user_id)
+    async def get_liked_post_ids(self, current_user_id: int, post_ids: list[int]) -> list[int]:
+        post_ids = list(dict.fromkeys(post_ids))
+        statuses = await self.like_status_port.get(current_user_id, post_ids)
+
+        missing_ids = [post_id for post_id in post_ids if post_id not in statuses]
+        if missing_ids:
+            liked_ids = set(await self.like_port.get_liked_post_ids(current_user_id, missing_ids))
+            loaded = {post_id: post_id in liked_ids for post_id in missing_ids}
+            await self.like_status_port.fill(current_user_id, loaded)
+            statuses.update(loaded)
+
+        return [post_id for post_id in post_ids if statuses[post_id]]
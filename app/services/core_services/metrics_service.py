@@ -0,0 +1,15 @@
+from app.domain.dto.metrics import CacheStats, WebsocketStats
+from app.domain.repositories.redis import IRedis
+from app.services.websockets.manager import WebsocketManager
+
+
+class MetricsService:
+    def __init__(self, cache_port: IRedis, websocket_manager: WebsocketManager) -> None:
+        self.cache_port = cache_port
+        self.websocket_manager = websocket_manager
+
+    async def get_cache_stats(self) -> CacheStats:
+        return await self.cache_port.get_stats()
+
+    def get_websocket_stats(self) -> WebsocketStats:
+        return self.websocket_manager.get_stats()
\ No newline at end of file
@@ -0,0 +1,44 @@
+from pydantic import ValidationError
+
+from app.domain.dto.post import PostCreate, PostImportError, PostImportReport
+from app.domain.repositories.post import IPost
+from app.domain.repositories.user import IUser
+
+
+def _format_validation_error(e: ValidationError) -> str:
+    return '; '.join(f"{'.'.join(map(str, error['loc'])) or 'row'}: {error['msg']}" for error in e.errors())
+
+
+class PostImportService:
+    def __init__(self, post_port: IPost, user_port: IUser) -> None:
+        self.post_port = post_port
+        self.user_port = user_port
+
+    async def import_batch(self, lines: list[tuple[int, str]]) -> PostImportReport:
+        """Валидирует пачку NDJSON-строк (номер, строка) и копирует корректные посты одним COPY."""
+        report = PostImportReport()
+        rows = dict(lines)
+        posts: list[tuple[int, PostCreate]] = []
+        for line_number, line in lines:
+            try:
+                posts.append((line_number, PostCreate.model_validate_json(line)))
+            except ValidationError as e:
+                report.errors.append(PostImportError(line=line_number,
+                                                     error=_format_validation_error(e),
+                                                     row=line.rstrip('\n')))
+
+        # строка с несуществующим автором сорвала бы COPY всей пачки по внешнему ключу
+        existing_user_ids = set(await self.user_port.filter_existing_ids(list({post.user_id for _, post in posts})))
+        valid_posts = []
+        for line_number, post in posts:
+            if post.user_id in existing_user_ids:
+                valid_posts.append(post)
+            else:
+                report.errors.append(PostImportError(line=line_number,
+                                                     error=f"user_id={post.user_id} does not exist",
+                                                     row=rows[line_number].rstrip('\n')))
+
+        if valid_posts:
+            report.imported = await self.post_port.bulk_save(valid_posts)
+        report.errors.sort(key=lambda error: error.line)
+        return report
\ No newline at end of file
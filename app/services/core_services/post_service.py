@@ -1,24 +1,77 @@
 from app.domain.dto.post import PostCreate, PostUpdate
-from app.domain.dto.pagination import PaginatedResponse
+from app.domain.dto.pagination import PaginatedResponse, CursorPaginatedResponse
 from app.domain.repositories.post import IPost
+from app.domain.repositories.feed import IFeed
+from app.domain.repositories.subscription import ISubscription
+from app.domain.repositories.trending import ITrending
+from app.domain.repositories.version import IVersion
+from app.domain.repositories.redis import IRedis
 from app.domain.entities.post import Post
+from app.domain.exceptions.post import PostDoesNotExist
+from app.infrastructure.settings.config import FEED_FANOUT_FOLLOWERS_LIMIT
+from app.services.caching import cached, invalidates
 
 
 class PostService:
-    def __init__(self, post_port: IPost):
+    def __init__(self,
+                 post_port: IPost,
+                 subscription_port: ISubscription,
+                 feed_port: IFeed,
+                 trending_port: ITrending,
+                 version_port: IVersion,
+                 cache_port: IRedis
+                 ) -> None:
         self.post_port = post_port
+        self.subscription_port = subscription_port
+        self.feed_port = feed_port
+        self.trending_port = trending_port
+        self.version_port = version_port
+        self.cache_port = cache_port
+        self.version_namespace = "posts"
 
     async def get_all_posts(self, offset: int, limit: int) -> PaginatedResponse:
         return await self.post_port.get_all_posts(offset, limit)
 
+    async def get_posts_by_cursor(self, cursor: str | None, limit: int) -> CursorPaginatedResponse:
+        return await self.post_port.get_posts_by_cursor(cursor, limit)
+
+    async def get_public_posts_by_cursor(self,
+                                         cursor: str | None,
+                                         limit: int,
+                                         current_user_id: int | None) -> CursorPaginatedResponse:
+        return await self.post_port.get_public_posts_by_cursor(cursor, limit, current_user_id)
+
+    async def search(self,
+                     query: str,
+                     cursor: str | None,
+                     limit: int,
+                     current_user_id: int | None) -> CursorPaginatedResponse:
+        return await self.post_port.search(query, cursor, limit, current_user_id)
+
+    @cached('cache.posts:{post_id}', Post, not_found=PostDoesNotExist)
     async def get_post(self, post_id: int) -> Post:
         return await self.post_port.get_post(post_id)
 
+    @invalidates('cache.posts:{result.id}')
     async def save(self, post: PostCreate) -> Post:
-        return await self.post_port.save(post)
+        result = await self.post_port.save(post)
+        await self.version_port.bump(self.version_namespace)
+        follower_ids = await self.subscription_port.get_follower_ids(post.user_id, FEED_FANOUT_FOLLOWERS_LIMIT + 1)
+        if len(follower_ids) > FEED_FANOUT_FOLLOWERS_LIMIT:
+            # посты популярных авторов подмешиваются в ленту при чтении, а не рассылаются подписчикам
+            await self.feed_port.push_celebrity(result.id, post.user_id)
+            follower_ids = []
+        await self.feed_port.push(result.id, [post.user_id, *follower_ids])
+        return result
 
+    @invalidates('cache.posts:{post_id}', 'cache.posts.public:{post_id}')
     async def delete(self, post_id: int, user_id: int) -> None:
         await self.post_port.delete(post_id, user_id)
+        await self.version_port.bump(self.version_namespace, f'comments:{post_id}')
+        await self.trending_port.remove(post_id)
 
+    @invalidates('cache.posts:{post.id}', 'cache.posts.public:{post.id}')
     async def update(self, post: PostUpdate, user_id: int) -> Post:
-        return await self.post_port.update(post, user_id)
+        result = await self.post_port.update(post, user_id)
+        await self.version_port.bump(self.version_namespace)
+        return result
@@ -1,11 +1,15 @@
 from app.domain.dto.profile import ProfilePublic
 from app.domain.repositories.profile import IProfile
+from app.domain.repositories.redis import IRedis
+from app.domain.exceptions.user import UserDoesNotExist
+from app.services.caching import cached
 
 
 class ProfileService:
-    def __init__(self, profile_port: IProfile):
+    def __init__(self, profile_port: IProfile, cache_port: IRedis):
         self.profile_port = profile_port
-        
-        
+        self.cache_port = cache_port
+
+    @cached('cache.profiles:{user_id}', ProfilePublic, not_found=UserDoesNotExist)
     async def get_by_user_id(self, user_id: int) -> ProfilePublic:
         return await self.profile_port.get_by_user_id(user_id)
\ No newline at end of file
@@ -0,0 +1,35 @@
+from app.domain.dto.post import PostPublic
+from app.domain.repositories.like import ILike
+from app.domain.repositories.post import IPost
+from app.domain.repositories.redis import IRedis
+from app.infrastructure.settings.config import POST_PUBLIC_CACHE_TTL
+from app.services.caching import get_many_cached
+
+
+class PublicPostService:
+    """Посты для списков (лента, популярное): общая для всех часть берется из кеша, liked_by_me - отдельно.
+
+    В кеше лежат посты без отметки пользователя, поэтому одна запись годится для всех читателей.
+    """
+
+    def __init__(self, post_port: IPost, like_port: ILike, cache_port: IRedis) -> None:
+        self.post_port = post_port
+        self.like_port = like_port
+        self.cache_port = cache_port
+        self.cache_path = 'cache.posts.public'
+
+    async def _load(self, post_ids: list[int]) -> dict[int, PostPublic]:
+        return {post.id: post for post in await self.post_port.get_public_by_ids(post_ids, None)}
+
+    async def get_by_ids(self, post_ids: list[int], current_user_id: int | None) -> list[PostPublic]:
+        """Посты в порядке post_ids; отсутствующие в БД пропускаются."""
+        posts = await get_many_cached(self.cache_port, f'{self.cache_path}:{{id}}', post_ids, self._load,
+                                      PostPublic, ttl=POST_PUBLIC_CACHE_TTL)
+
+        liked_ids = set()
+        if current_user_id is not None and posts:
+            liked_ids = set(await self.like_port.get_liked_post_ids(current_user_id, list(posts)))
+        return [
+            posts[post_id].model_copy(update={'liked_by_me': post_id in liked_ids})
+            for post_id in post_ids if post_id in posts
+        ]
\ No newline at end of file
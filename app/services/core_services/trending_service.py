@@ -0,0 +1,17 @@
+from app.domain.dto.pagination import PaginatedResponse
+from app.domain.repositories.trending import ITrending
+from app.services.core_services.public_post_service import PublicPostService
+
+
+class TrendingService:
+    def __init__(self, trending_port: ITrending, public_post_service: PublicPostService) -> None:
+        self.trending_port = trending_port
+        self.public_post_service = public_post_service
+
+    async def get_trending(self, offset: int, limit: int, current_user_id: int | None) -> PaginatedResponse:
+        page = await self.trending_port.get_page(offset, limit)
+        page.results = await self.public_post_service.get_by_ids(page.results, current_user_id)
+        return page
+
+    async def trim(self) -> int:
+        return await self.trending_port.trim()
\ No newline at end of file
@@ -2,26 +2,36 @@ from app.domain.dto.pagination import PaginatedResponse
 from app.domain.exceptions.user import UserDoesNotExist
 from app.domain.dto.user import UserCreate, UserDB
 from app.domain.repositories.user import IUser
+from app.domain.repositories.redis import IRedis
 from app.domain.entities.user import User
 from app.infrastructure.settings.security import decode_access_token
+from app.services.caching import cached, cached_not_found, invalidates
 
 
 class UserService:
-    def __init__(self, user_port: IUser) -> None:
+    def __init__(self, user_port: IUser, cache_port: IRedis) -> None:
         self.user_port = user_port
+        self.cache_port = cache_port
 
+    @invalidates('cache.users:{result.id}', 'cache.profiles:{result.id}', 'cache.users.email:{user_create.email}')
     async def save(self, user_create: UserCreate) -> User:
         return await self.user_port.save(user_create)
 
     async def get_all(self, offset: int, limit: int) -> PaginatedResponse:
         return await self.user_port.get_all(offset, limit)
     
+    @cached('cache.users:{user_id}', User, not_found=UserDoesNotExist)
     async def get_by_id(self, user_id: int) -> User:
         return await self.user_port.get_by_id(user_id)
 
     async def _get_by_email(self, email: str) -> UserDB:
         return await self.user_port.get_by_email(email)
 
+    @cached_not_found('cache.users.email:{email}', UserDoesNotExist)
+    async def _get_for_login(self, email: str) -> UserDB:
+        """Поиск при входе: неверные email запоминаются, чтобы перебор не нагружал БД."""
+        return await self.user_port.get_by_email(email)
+
     async def _get_by_token(self, token: str) -> UserDB:
         email = decode_access_token(token)
         if not email:
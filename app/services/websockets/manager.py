@@ -0,0 +1,185 @@
+import asyncio
+import json
+import logging
+from collections import Counter
+from typing import Awaitable, Callable
+
+from fastapi import WebSocket
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
+
+from app.domain.dto.metrics import WebsocketStats
+from app.infrastructure.database.redis import RedisClient
+from app.infrastructure.settings.config import CHAT_CHANNEL_PREFIX, WS_SEND_QUEUE_SIZE, WS_SLOW_CONSUMER_POLICY
+
+# сокет закрывается с 1013 Try Again Later, клиент может переподключиться
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+
+class Connection:
+    """Сокет пользователя с ограниченной очередью отправки и собственной задачей-писателем.
+
+    chats - чаты, на которые подписан сокет; участие в них проверено при подписке.
+    on_failure вызывается, когда отправка в сокет не удалась, чтобы менеджер снял его с учета.
+    """
+
+    def __init__(self,
+                 websocket: WebSocket,
+                 user_id: int,
+                 on_failure: Callable[['Connection'], Awaitable[None]]):
+        self.websocket = websocket
+        self.user_id = user_id
+        self.chats: set[int] = set()
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=WS_SEND_QUEUE_SIZE)
+        self._on_failure = on_failure
+        self._failure_task: asyncio.Task | None = None
+        self.writer = asyncio.create_task(self._write())
+
+    async def _write(self):
+        try:
+            while True:
+                payload = await self.queue.get()
+                await self.websocket.send_text(payload)
+        except Exception as e:
+            logging.warning(f"Websocket writer of user {self.user_id} stopped: {e}")
+            # отдельной задачей: отключение отменяет писателя, который сейчас выполняется
+            self._failure_task = asyncio.create_task(self._on_failure(self))
+
+    async def close(self, code: int | None = None):
+        self.writer.cancel()
+        if code is not None:
+            try:
+                await self.websocket.close(code=code)
+            except Exception as e:
+                logging.warning(f"Failed to close websocket of user {self.user_id}: {e}")
+
+
+class WebsocketManager:
+    """Сокеты текущего воркера, связанные с остальными воркерами через Redis pub/sub.
+
+    Один сокет пользователя несет все его чаты; сокеты индексированы по пользователю и по чату.
+    broadcast публикует сообщение один раз в канал чата. Воркер подписан только на каналы чатов,
+    на которые подписан хотя бы один его сокет, и раздает полученные сообщения своим сокетам.
+    Доставка не ждет сокетов: сообщение сериализуется один раз и кладется в очереди получателей,
+    медленные получатели обрабатываются по WS_SLOW_CONSUMER_POLICY.
+    """
+
+    def __init__(self):
+        self.connections_by_user: dict[int, set[Connection]] = {}
+        self.connections_by_chat: dict[int, set[Connection]] = {}
+        self._pubsub: PubSub | None = None
+        self._stats = Counter()
+
+    def _channel(self, chat_id: int) -> str:
+        return f'{CHAT_CHANNEL_PREFIX}:{chat_id}'
+
+    async def connect(self, websocket: WebSocket, user_id: int) -> Connection:
+        await websocket.accept()
+        connection = Connection(websocket, user_id, self.disconnect)
+        self.connections_by_user.setdefault(user_id, set()).add(connection)
+        return connection
+
+    async def subscribe(self, connection: Connection, chat_id: int):
+        if chat_id not in self.connections_by_chat:
+            self.connections_by_chat[chat_id] = set()
+            # без слушателя подписки восстановятся при его запуске
+            if self._pubsub is not None:
+                await self._pubsub.subscribe(self._channel(chat_id))
+        self.connections_by_chat[chat_id].add(connection)
+        connection.chats.add(chat_id)
+
+    async def unsubscribe(self, connection: Connection, chat_id: int):
+        connection.chats.discard(chat_id)
+        connections = self.connections_by_chat.get(chat_id)
+        if connections is None or connection not in connections:
+            return
+        connections.remove(connection)
+        if not connections:
+            del self.connections_by_chat[chat_id]
+            if self._pubsub is not None:
+                await self._pubsub.unsubscribe(self._channel(chat_id))
+
+    async def disconnect(self, connection: Connection, code: int | None = None):
+        connections = self.connections_by_user.get(connection.user_id)
+        if connections is None or connection not in connections:
+            return
+        connections.remove(connection)
+        if not connections:
+            del self.connections_by_user[connection.user_id]
+        for chat_id in list(connection.chats):
+            await self.unsubscribe(connection, chat_id)
+        await connection.close(code)
+
+    async def broadcast(self,
+                        message: str,
+                        chat_id: int,
+                        sender_id: int,
+                        message_id: int | None = None,
+                        seq: int | None = None):
+        message_with_class = {
+            "type": "message",
+            "id": message_id,
+            "seq": seq,
+            "chat_id": chat_id,
+            "text": message,
+            "sender_id": sender_id,
+        }
+        await RedisClient.get_redis().publish(self._channel(chat_id), json.dumps(message_with_class))
+
+    async def send(self, connection: Connection, message: dict):
+        """Отправляет служебное сообщение (ack, ошибку) одному сокету."""
+        await self._enqueue(connection, json.dumps(message))
+
+    async def _enqueue(self, connection: Connection, payload: str):
+        try:
+            connection.queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            if WS_SLOW_CONSUMER_POLICY == 'drop':
+                self._stats['dropped'] += 1
+                return
+            self._stats['slow_disconnects'] += 1
+            logging.warning(f"User {connection.user_id} is too slow, disconnecting")
+            await self.disconnect(connection, SLOW_CONSUMER_CLOSE_CODE)
+
+    async def _send_local(self, chat_id: int, payload: str):
+        for connection in list(self.connections_by_chat.get(chat_id, ())):
+            await self._enqueue(connection, payload)
+
+    def get_stats(self) -> WebsocketStats:
+        depths = [connection.queue.qsize()
+                  for connections in self.connections_by_user.values()
+                  for connection in connections]
+        return WebsocketStats(
+            connections=len(depths),
+            users=len(self.connections_by_user),
+            chats=len(self.connections_by_chat),
+            queued=sum(depths),
+            max_queue_depth=max(depths, default=0),
+            dropped=self._stats['dropped'],
+            slow_disconnects=self._stats['slow_disconnects']
+        )
+
+    async def listen(self, redis: Redis):
+        """Доставляет локальным сокетам сообщения чатов, опубликованные любым воркером."""
+        pubsub = redis.pubsub(ignore_subscribe_messages=True)
+        self._pubsub = pubsub
+        try:
+            if self.connections_by_chat:
+                await pubsub.subscribe(*map(self._channel, self.connections_by_chat))
+            while True:
+                if not pubsub.subscribed:
+                    # до первой подписки у pubsub нет соединения, читать нечего
+                    await asyncio.sleep(0.1)
+                    continue
+                message = await pubsub.get_message(timeout=1.0)
+                if message is None:
+                    continue
+                chat_id = int(message['channel'].rsplit(':', 1)[1])
+                # опубликованный JSON уходит клиентам как есть, без повторной сериализации
+                await self._send_local(chat_id, message['data'])
+        finally:
+            self._pubsub = None
+            await pubsub.aclose()
+
+
+websocket_manager = WebsocketManager()
\ No newline at end of file
@@ -0,0 +1,67 @@
+"""Сравнение форматов кеша: размер записи в Redis и время обработки попадания.
+
+Запуск из корня репозитория (orjson и zstandard необязательны):
+
+    python -m benchmarks.cache_codecs
+
+baseline - прежний путь: json.dumps(model_dump()) при записи, json.loads и
+PaginatedResponse(**value) с повторной валидацией при каждом попадании.
+Остальные варианты отдают сохраненные байты клиенту без разбора (raw);
+decoded - попадание через get_or_set, которому нужен разобранный объект.
+"""
+import json
+import timeit
+from datetime import datetime, timedelta
+
+from app.domain.dto.pagination import PaginatedResponse
+from app.domain.entities.chat import ChatMessage
+from app.infrastructure.database.repositories.utils.codecs import JsonCodec, get_codec, compress, decompress
+
+PAGE_SIZES = (20, 100)
+NUMBER = 2000
+
+
+def _page(size: int) -> PaginatedResponse:
+    created_at = datetime(2026, 1, 1)
+    messages = [
+        ChatMessage(
+            id=i,
+            chat_id=1,
+            user_id=i % 2 + 1,
+            text=f'message {i}: ' + 'lorem ipsum dolor sit amet ' * 4,
+            created_at=created_at + timedelta(seconds=i),
+            updated_at=created_at + timedelta(seconds=i)
+        )
+        for i in range(size)
+    ]
+    return PaginatedResponse(
+        count=10_000,
+        prev='http://127.0.0.1:8000/api/messages/chats_history/1?offset=0&limit=20',
+        next='http://127.0.0.1:8000/api/messages/chats_history/1?offset=40&limit=20',
+        results=messages
+    )
+
+
+def _microseconds(func) -> float:
+    return min(timeit.repeat(func, number=NUMBER, repeat=5)) / NUMBER * 1_000_000
+
+
+def run() -> None:
+    variants = [('json', JsonCodec(), 0), ('orjson', get_codec('orjson'), 0), ('orjson+zstd', get_codec('orjson'), 1)]
+    print(f"{'variant':<14}{'page':>6}{'bytes':>10}{'raw µs':>10}{'decoded µs':>12}")
+    for size in PAGE_SIZES:
+        page = _page(size)
+
+        stored = json.dumps(page.model_dump(mode='json')).encode()
+        hit = lambda: PaginatedResponse(**json.loads(stored))
+        print(f"{'baseline':<14}{size:>6}{len(stored):>10}{'-':>10}{_microseconds(hit):>12.1f}")
+
+        for name, codec, min_size in variants:
+            stored = compress(codec.dumps(page), min_size, 3)
+            raw_hit = lambda: decompress(stored)
+            decoded_hit = lambda: codec.loads(decompress(stored))
+            print(f"{name:<14}{size:>6}{len(stored):>10}{_microseconds(raw_hit):>10.1f}{_microseconds(decoded_hit):>12.1f}")
+
+
+if __name__ == '__main__':
+    run()
\ No newline at end of file